@@ -20,7 +20,7 @@ from decimal import Decimal
 from typing import Optional, Dict
 from dataclasses import dataclass
 
-from packages.core.storage.queries import MarketQueries, AnalyticsQueries, VolumeQueries
+from packages.core.storage.queries import MOVERS_CACHE_WINDOWS, MarketQueries, AnalyticsQueries, VolumeQueries
 from packages.core.storage.db import get_db_pool
 from packages.core.analytics import metrics
 from packages.core.analytics.metrics import MoverScorer, ZScoreMoverScorer
@@ -28,9 +28,9 @@ from packages.core.settings import settings
 
 logger = logging.getLogger(__name__)
 
-# Windows to precompute: 5m, 15m, 1h, 24h
-WINDOWS = [300, 900, 3600, 86400]
-WINDOW_TO_MINUTES = {300: 5, 900: 15, 3600: 60, 86400: 1440}
+# Windows to precompute: 5m, 15m, 30m, 1h, 4h, 12h, 24h
+WINDOWS = list(MOVERS_CACHE_WINDOWS)
+WINDOW_TO_MINUTES = {window: window // 60 for window in WINDOWS}
 
 # Minimum quality score to be included (filters noise)
 MIN_QUALITY_SCORE = Decimal("1.0")
@@ -3,13 +3,24 @@ Prediction Market Movers - Combined Dashboard
 Real-time tracking of Polymarket & Kalshi price movements
 """
 
+import time
+
 import streamlit as st
 from datetime import datetime, timezone
+from html import escape
 
 from packages.core.settings import settings
-from packages.core.storage import get_db_pool
-from packages.core.storage.queries import MarketQueries, AnalyticsQueries
+from packages.core.storage.queries import MOVERS_CACHE_WINDOWS, MarketQueries, AnalyticsQueries
 from packages.core.wss import WSSMetrics
+from apps.dashboard.components import FONT_LINKS, format_volume, get_dashboard_db_pool, minify_css
+
+# Snapshots newer than this mean the collector is still writing data
+RECENT_DATA_WINDOW_SECONDS = 300
+
+# Header status and quick stats refresh on their own as fragments, so
+# keeping them current doesn't rerun the movers list
+HEADER_REFRESH_SECONDS = 10
+STATS_REFRESH_SECONDS = 30
 
 # Page configuration
 st.set_page_config(
@@ -24,17 +35,14 @@ def init_theme():
     """Initialize theme in session state."""
     if "dark_mode" not in st.session_state:
         st.session_state.dark_mode = False
+    # A toggle change reruns the script with the new value already in
+    # session state, so pick it up before any CSS is emitted.
+    if "theme_toggle" in st.session_state:
+        st.session_state.dark_mode = st.session_state.theme_toggle
 
 
-def get_theme_css():
-    """Generate CSS based on current theme."""
-    dark_mode = st.session_state.get("dark_mode", False)
-    
-    if dark_mode:
-        return """
+_DARK_THEME_CSS = """
         <style>
-            @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=IBM+Plex+Mono:wght@400;500;600&display=swap');
-            
             :root {
                 --pm-bg: #0c0c10;
                 --pm-surface: #14141a;
@@ -72,11 +80,9 @@ def get_theme_css():
             }
         </style>
         """
-    else:
-        return """
+
+_LIGHT_THEME_CSS = """
         <style>
-            @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=IBM+Plex+Mono:wght@400;500;600&display=swap');
-            
             :root {
                 --pm-bg: #fafafa;
                 --pm-surface: #ffffff;
@@ -115,10 +121,7 @@ def get_theme_css():
         </style>
         """
 
-
-def get_component_css():
-    """Get component styles that work with both themes."""
-    return """
+_COMPONENT_CSS = """
     <style>
         .header-container {
             display: flex;
@@ -392,10 +395,18 @@ def get_component_css():
     """
 
 
-def check_database_connection() -> tuple[bool, str]:
-    """Check if database is accessible."""
+
+# Theme + component styles per dark_mode value, minified once and emitted as one element
+_PAGE_CSS = {
+    True: FONT_LINKS + minify_css(_DARK_THEME_CSS + _COMPONENT_CSS),
+    False: FONT_LINKS + minify_css(_LIGHT_THEME_CSS + _COMPONENT_CSS),
+}
+
+
+def _probe_database() -> tuple[bool, str]:
+    """Run one health check; the pool connection is released as soon as it returns."""
     try:
-        db = get_db_pool()
+        db = get_dashboard_db_pool()
         if db.health_check():
             stats = db.get_pool_stats()
             return True, f"pool {stats.get('size', 0)}/{stats.get('max_size', 0)}"
@@ -404,6 +415,17 @@ def check_database_connection() -> tuple[bool, str]:
         return False, str(e)
 
 
+@st.cache_data(ttl=settings.dashboard_health_check_interval_seconds, show_spinner=False)
+def check_database_connection() -> tuple[bool, str]:
+    """
+    Return the database health status.
+
+    Cached for ``dashboard_health_check_interval_seconds`` so reruns and
+    sessions share one probe per interval instead of querying every time.
+    """
+    return _probe_database()
+
+
 def get_wss_status() -> dict:
     """Get accurate WSS connection status by checking actual data flow."""
     # Use activity-based check for accurate status
@@ -421,18 +443,18 @@ def get_wss_status() -> dict:
     
     # Update last message age based on stored time
     if metrics.last_message_time > 0:
-        import time
         status["last_message_age"] = time.time() - metrics.last_message_time
     
     # Check if DB has recent data (within 5 minutes) even if WSS is "disconnected"
     db_has_recent_data = False
     try:
-        db = get_db_pool()
-        result = db.execute("""
-            SELECT COUNT(*) as cnt FROM snapshots 
-            WHERE ts > NOW() - INTERVAL '5 minutes'
-        """, fetch=True)
-        db_has_recent_data = result and result[0]['cnt'] > 0
+        db = get_dashboard_db_pool()
+        db_has_recent_data = bool(db.scalar("""
+            SELECT EXISTS (
+                SELECT 1 FROM snapshots
+                WHERE ts > NOW() - (%s * INTERVAL '1 second')
+            )
+        """, (RECENT_DATA_WINDOW_SECONDS,), prepare=True))
     except Exception:
         pass
     
@@ -458,9 +480,10 @@ def get_wss_status() -> dict:
     return status
 
 
+@st.cache_data(ttl=30, show_spinner=False)
 def get_stats() -> dict:
-    """Fetch dashboard stats from database."""
-    db = get_db_pool()
+    """Fetch dashboard stats from database in a single round-trip."""
+    db = get_dashboard_db_pool()
     stats = {
         "markets": 0,
         "tokens": 0,
@@ -469,47 +492,100 @@ def get_stats() -> dict:
     }
     
     try:
-        market_count = db.execute(
-            "SELECT COUNT(*) as count FROM markets WHERE status = 'active'",
-            fetch=True
-        )
-        stats["markets"] = market_count[0]["count"] if market_count else 0
-        
-        token_count = db.execute(
-            "SELECT COUNT(*) as count FROM market_tokens",
-            fetch=True
-        )
-        stats["tokens"] = token_count[0]["count"] if token_count else 0
-        
-        snapshot_count = db.execute(
-            "SELECT COUNT(*) as count FROM snapshots",
-            fetch=True
-        )
-        stats["snapshots"] = snapshot_count[0]["count"] if snapshot_count else 0
-        
-        latest_snapshot = db.execute(
-            "SELECT MAX(ts) as latest FROM snapshots",
-            fetch=True
-        )
-        if latest_snapshot and latest_snapshot[0]["latest"]:
-            latest = latest_snapshot[0]["latest"]
-            stats["last_update"] = str(latest)[11:19]  # Just time portion
+        result = db.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM markets WHERE status = 'active') as markets,
+                (SELECT COUNT(*) FROM market_tokens) as tokens,
+                (SELECT COUNT(*) FROM snapshots) as snapshots,
+                (SELECT ts FROM snapshots ORDER BY ts DESC LIMIT 1) as latest
+        """, fetch=True)
+        if result:
+            row = result[0]
+            stats["markets"] = row["markets"] or 0
+            stats["tokens"] = row["tokens"] or 0
+            stats["snapshots"] = row["snapshots"] or 0
+            if row["latest"]:
+                stats["last_update"] = str(row["latest"])[11:19]  # Just time portion
     except Exception:
         pass
     
     return stats
 
 
-def format_volume(volume: float) -> str:
-    """Format volume as human-readable string."""
-    if volume >= 1_000_000:
-        return f"${volume/1_000_000:.1f}M"
-    elif volume >= 1_000:
-        return f"${volume/1_000:.1f}k"
-    else:
-        return f"${volume:.0f}"
+# Windows the collector keeps in movers_cache
+CACHED_WINDOWS = frozenset(MOVERS_CACHE_WINDOWS)
+
+
+@st.cache_data(ttl=30, max_entries=128, show_spinner=False)
+def get_movers(window_seconds: int, limit: int, category: str | None) -> list[dict]:
+    """
+    Movers for a window and category, from the movers cache when it covers
+    the window and the live window query otherwise.
 
+    Cached so theme toggles, searches and other reruns reuse the rows.
+    """
+    # Standard windows try the cache and fall back to the live query in SQL
+    if window_seconds in CACHED_WINDOWS:
+        return AnalyticsQueries.get_movers_with_fallback(
+            window_seconds=window_seconds,
+            limit=limit,
+            category=category,
+            direction="both"
+        )
+
+    return MarketQueries.get_movers_window(
+        window_seconds=window_seconds,
+        limit=limit,
+        category=category,
+        direction="both"
+    )
+
+
+# Same floor as the API's /markets/search; shorter terms match nearly every title
+SEARCH_MIN_CHARS = 2
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def search_market_cards(query: str) -> list[dict]:
+    """
+    Search markets, returning each hit's top token shaped like a mover row.
+
+    Cached per query string so re-running the script with the same search
+    (widget changes, reruns, retyping the same term) doesn't go back to the DB.
+    """
+    return MarketQueries.search_markets_with_top_token(query, limit=20)
 
+
+_SIDEBAR_SETTINGS_CAPTION = (
+    f"**Sync Interval:** {settings.sync_interval_seconds}s  \n"
+    f"**Log Level:** {settings.log_level}"
+)
+
+_SIDEBAR_SOURCES_CAPTION = (
+    f"**Polymarket:** {'✓ Active' if settings.polymarket_api_key else '○ No key'}  \n"
+    f"**Kalshi:** {'✓ Active' if settings.kalshi_api_key else '○ No key'}"
+)
+
+_HEADER_LOGO_HTML = """
+        <div class="logo-section">
+            <div class="logo-icon">📈</div>
+            <div>
+                <p class="logo-text">Prediction Market Movers</p>
+                <p class="logo-subtitle">Polymarket & Kalshi • Live</p>
+            </div>
+        </div>"""
+
+
+def render_header_stub():
+    """Render the header logo only, without status lookups."""
+    st.markdown(f"""
+    <div class="header-container">
+        {_HEADER_LOGO_HTML}
+    </div>
+    """, unsafe_allow_html=True)
+
+
+@st.fragment(run_every=HEADER_REFRESH_SECONDS)
 def render_header():
     """Render the header with logo, status, and theme toggle."""
     wss_status = get_wss_status()
@@ -536,13 +612,7 @@ def render_header():
     
     st.markdown(f"""
     <div class="header-container">
-        <div class="logo-section">
-            <div class="logo-icon">📈</div>
-            <div>
-                <p class="logo-text">Prediction Market Movers</p>
-                <p class="logo-subtitle">Polymarket & Kalshi • Live</p>
-            </div>
-        </div>
+        {_HEADER_LOGO_HTML}
         <div>
             <div class="status-row">
                 <div class="status-badge status-{wss_class}">
@@ -559,6 +629,7 @@ def render_header():
     """, unsafe_allow_html=True)
 
 
+@st.fragment(run_every=STATS_REFRESH_SECONDS)
 def render_stats():
     """Render quick stats cards."""
     stats = get_stats()
@@ -585,80 +656,157 @@ def render_stats():
     """, unsafe_allow_html=True)
 
 
-def render_mover_card(mover: dict):
-    """Render a single mover card."""
-    pct_change = float(mover.get("pct_change") or mover.get("move_pp") or 0)
-    change_class = "positive" if pct_change > 0 else "negative"
-    change_sign = "+" if pct_change > 0 else ""
-    
-    source = mover.get("source", "unknown").upper()
-    outcome = mover.get("outcome", "YES")
-    outcome_class = "yes" if outcome == "YES" else "no"
-    
-    latest_price = float(mover.get("latest_price") or mover.get("price_now") or 0)
-    old_price = float(mover.get("old_price") or mover.get("price_then") or 0)
-    volume = float(mover.get("latest_volume") or mover.get("current_volume") or mover.get("volume_24h") or 0)
-    
-    title = mover.get('title', 'Unknown Market')
-    category = mover.get('category', '')
-    
-    # Generate reason
-    direction = "spiked" if pct_change > 0 else "dropped"
-    vol_str = format_volume(volume)
-    volume_source = mover.get('volume_source', '')
-    
-    # Add volume source indicator
-    source_indicator = ''
-    if volume_source == 'wss':
-        source_indicator = ' ⚡'  # Lightning bolt for real-time WSS
-    elif volume_source == 'gamma':
-        source_indicator = ' 📊'  # Chart for Gamma API
-    
-    reason = f"{outcome} {direction} {abs(pct_change):.1f}pp on {vol_str} volume{source_indicator}"
-    
-    # Category tag
-    category_html = f'<span class="tag tag-category">{category}</span>' if category else ''
-    
-    html_content = f"""<div class="mover-card"><div class="mover-header"><div style="flex: 1;"><div class="mover-tags"><span class="tag tag-source">{source}</span><span class="tag tag-{outcome_class}">{outcome}</span>{category_html}</div><p class="mover-title">{title}</p><p class="mover-price">${old_price:.2f} → ${latest_price:.2f}</p></div><div class="mover-change {change_class}">{change_sign}{pct_change:.1f}pp</div></div><div class="mover-reason">{reason}</div></div>"""
-    
-    st.markdown(html_content, unsafe_allow_html=True)
+# Mover card markup, formatted once per card via format_map(_mover_card_fields(...))
+_MOVER_CARD_TEMPLATE = (
+    '<div class="mover-card"><div class="mover-header"><div style="flex: 1;">'
+    '<div class="mover-tags"><span class="tag tag-source">{source}</span>'
+    '<span class="tag tag-{outcome_class}">{outcome}</span>{category_html}</div>'
+    '<p class="mover-title">{title}</p>'
+    '<p class="mover-price">${old_price:.2f} → ${latest_price:.2f}</p></div>'
+    '<div class="mover-change {change_class}">{change_sign}{pct_change:.1f}pp</div></div>'
+    '<div class="mover-reason">{reason}</div></div>'
+)
+
+_VOLUME_SOURCE_INDICATORS = {
+    'wss': ' ⚡',  # Lightning bolt for real-time WSS
+    'gamma': ' 📊',  # Chart for Gamma API
+}
+
+
+def _mover_card_fields(mover: dict) -> dict:
+    """Resolve a mover row into the fields used by the card template.
+
+    Numeric columns arrive as floats (cast in SQL), so no per-field coercion.
+    """
+    get = mover.get
+    pct_change = get("pct_change") or get("move_pp") or 0.0
+    positive = pct_change > 0
+    outcome = get("outcome", "YES")
+    volume = get("latest_volume") or get("current_volume") or get("volume_24h") or 0.0
+    category = get('category', '')
+
+    source_indicator = _VOLUME_SOURCE_INDICATORS.get(get('volume_source', ''), '')
+    direction = "spiked" if positive else "dropped"
+
+    return {
+        "source": escape(str(get("source") or "unknown").upper()),
+        "outcome": escape(str(outcome)),
+        "outcome_class": "yes" if outcome == "YES" else "no",
+        "category_html": f'<span class="tag tag-category">{escape(str(category))}</span>' if category else '',
+        "title": escape(str(get('title') or 'Unknown Market')),
+        "old_price": get("old_price") or get("price_then") or 0.0,
+        "latest_price": get("latest_price") or get("price_now") or 0.0,
+        "change_class": "positive" if positive else "negative",
+        "change_sign": "+" if positive else "",
+        "pct_change": pct_change,
+        "reason": escape(
+            f"{outcome} {direction} {abs(pct_change):.1f}pp on "
+            f"{format_volume(volume)} volume{source_indicator}"
+        ),
+    }
+
+
+def build_mover_card_html(mover: dict) -> str:
+    """Build escaped HTML for a single mover card."""
+    return _MOVER_CARD_TEMPLATE.format_map(_mover_card_fields(mover))
+
+
+# Cards added per "Load more"; the fetch limit grows with the shown count
+MOVERS_PAGE_SIZE = 20
+
+
+def _reset_movers_page() -> None:
+    """Start the movers list back at the first page when its filters change."""
+    st.session_state.movers_shown = MOVERS_PAGE_SIZE
+
+
+# Filter choices are fixed, so build them once instead of on every rerun
+TIMEFRAME_OPTIONS = {"5min": 5, "1hr": 60, "24hr": 1440, "7day": 10080}
+TIMEFRAME_LABELS = tuple(TIMEFRAME_OPTIONS)
+
+CATEGORIES = (
+    "All", "Politics", "Sports", "Crypto", "Finance", "Geopolitics",
+    "Tech", "Culture", "World", "Economy", "Climate & Science", "Elections",
+)
+
+
+def render_mover_cards(movers: list[dict]):
+    """Render all mover cards with a single markdown element."""
+    st.markdown("".join([build_mover_card_html(mover) for mover in movers]), unsafe_allow_html=True)
+
+
+@st.fragment
+def _render_movers_list(window_seconds: int, category_filter: str | None) -> None:
+    """
+    Render the shown pages of movers with a "Load more" button.
+
+    Fetches one row past the shown count to know whether another page
+    exists; loading more reruns only this fragment.
+    """
+    shown = st.session_state.setdefault("movers_shown", MOVERS_PAGE_SIZE)
+    try:
+        movers = get_movers(window_seconds, shown + 1, category_filter)
+        # The extra row only signals another page; it is not rendered or counted
+        page = movers[:shown]
+        
+        # Ensure volume data is available for display
+        # The queries now use v_latest_volumes which prefers WSS over Gamma
+        if movers:
+            # Log volume source for debugging
+            wss_count = sum(m.get('volume_source') == 'wss' for m in page)
+            gamma_count = sum(m.get('volume_source') == 'gamma' for m in page)
+            if wss_count > 0 or gamma_count > 0:
+                st.session_state['volume_debug'] = f"WSS: {wss_count}, Gamma: {gamma_count}"
+        
+        if not movers:
+            st.markdown("""
+            <div class="empty-state">
+                <div class="empty-state-icon">📭</div>
+                <p>No movers found for this timeframe and category.</p>
+                <p style="font-size: 0.85rem;">Try a different filter or wait for more data.</p>
+            </div>
+            """, unsafe_allow_html=True)
+            return
+        
+        # Show volume debug info if available
+        if 'volume_debug' in st.session_state and st.session_state['volume_debug']:
+            st.markdown(f"""
+            <div style="font-size: 0.75rem; color: var(--pm-text-muted); margin-bottom: 1rem;">
+                Volume sources: {st.session_state['volume_debug']}
+            </div>
+            """, unsafe_allow_html=True)
+        
+        render_mover_cards(page)
+        if len(movers) > shown and st.button("Load more", width="stretch"):
+            st.session_state.movers_shown = shown + MOVERS_PAGE_SIZE
+            st.rerun(scope="fragment")
+            
+    except Exception as e:
+        st.error(f"Error loading movers: {e}")
 
 
 def main():
     """Main dashboard - combined landing page."""
     init_theme()
     
-    # Apply theme CSS
-    st.markdown(get_theme_css(), unsafe_allow_html=True)
-    st.markdown(get_component_css(), unsafe_allow_html=True)
+    # Apply theme + component CSS in a single element
+    st.markdown(_PAGE_CSS[st.session_state.dark_mode], unsafe_allow_html=True)
     
     # Theme toggle in sidebar
     with st.sidebar:
         st.markdown("### ⚙️ Settings")
         
-        dark_mode = st.toggle(
+        st.toggle(
             "Dark Mode",
             value=st.session_state.dark_mode,
             key="theme_toggle"
         )
-        if dark_mode != st.session_state.dark_mode:
-            st.session_state.dark_mode = dark_mode
-            st.rerun()
-        
-        st.markdown("---")
-        
-        # Additional settings
-        st.caption(f"**Sync Interval:** {settings.sync_interval_seconds}s")
-        st.caption(f"**Log Level:** {settings.log_level}")
         
+        # Settings are fixed for the process, so the captions are built at import time
         st.markdown("---")
-        st.markdown("### 📊 Data Sources")
-        
-        poly_status = "✓ Active" if settings.polymarket_api_key else "○ No key"
-        kalshi_status = "✓ Active" if settings.kalshi_api_key else "○ No key"
-        
-        st.caption(f"**Polymarket:** {poly_status}")
-        st.caption(f"**Kalshi:** {kalshi_status}")
+        st.caption(_SIDEBAR_SETTINGS_CAPTION)
+        st.markdown("---\n\n### 📊 Data Sources")
+        st.caption(_SIDEBAR_SOURCES_CAPTION)
     
     # Check database
     db_healthy, _ = check_database_connection()
@@ -666,47 +814,39 @@ def main():
         st.error("⚠️ Database connection failed. Please check your configuration.")
         return
     
-    # Header with status
-    render_header()
+    # Header and stats sit above the search bar, but are only filled in
+    # when not searching so search reruns skip their DB queries.
+    header_slot = st.container()
     
-    # Stats row
-    render_stats()
-    
-    # Search bar
+    # Search bar (Streamlit only commits text_input on Enter/blur; the
+    # normalized query keys the cached search so repeats skip the DB)
     search_query = st.text_input(
         "Search markets",
         placeholder="Search: trump, bitcoin, fed, elections...",
         label_visibility="collapsed",
-    )
+    ).strip()
     
     if search_query:
-        results = MarketQueries.search_markets(search_query)
+        with header_slot:
+            render_header_stub()
+        if len(search_query) < SEARCH_MIN_CHARS:
+            st.caption(f"Type at least {SEARCH_MIN_CHARS} characters to search.")
+            return
+        results = search_market_cards(search_query.lower())
         if not results:
             st.info(f"No markets found for '{search_query}'")
         else:
-            st.markdown(f'<div class="section-header">🔍 Results for "{search_query}"</div>', unsafe_allow_html=True)
-            ids = [str(r['market_id']) for r in results[:20]]
-            full_data = MarketQueries.get_markets_batch_with_prices(ids)
-            for market in full_data:
-                tokens = market.get('tokens', [])
-                if not tokens:
-                    continue
-                top_token = tokens[0]
-                mover_wrapper = {
-                    'market_id': market['market_id'],
-                    'token_id': top_token.get('token_id'),
-                    'title': market['title'],
-                    'source': market['source'],
-                    'category': market['category'],
-                    'outcome': top_token.get('outcome'),
-                    'latest_price': top_token.get('latest_price', 0),
-                    'latest_volume': top_token.get('latest_volume', 0),
-                    'pct_change': 0,
-                    'old_price': 0
-                }
-                render_mover_card(mover_wrapper)
+            st.markdown(f'<div class="section-header">🔍 Results for "{escape(search_query)}"</div>', unsafe_allow_html=True)
+            render_mover_cards(results)
         return
     
+    with header_slot:
+        # Header with status
+        render_header()
+        
+        # Stats row
+        render_stats()
+    
     # Section header
     st.markdown('<div class="section-header">🔥 What\'s Moving Now</div>', unsafe_allow_html=True)
     
@@ -714,85 +854,27 @@ def main():
     col1, col2 = st.columns([1, 3])
     
     with col1:
-        tf_map = {"5min": 5, "1hr": 60, "24hr": 1440, "7day": 10080}
         selected_tf = st.selectbox(
             "Timeframe",
-            options=list(tf_map.keys()),
+            options=TIMEFRAME_LABELS,
             index=1,
-            label_visibility="collapsed"
+            label_visibility="collapsed",
+            on_change=_reset_movers_page,
         )
-        window_minutes = tf_map[selected_tf]
+        window_minutes = TIMEFRAME_OPTIONS[selected_tf]
     
     with col2:
-        CATEGORIES = [
-            "All", "Politics", "Sports", "Crypto", "Finance", "Geopolitics",
-            "Tech", "Culture", "World", "Economy", "Climate & Science", "Elections"
-        ]
         selected_category = st.selectbox(
             "Category",
             options=CATEGORIES,
             index=0,
-            label_visibility="collapsed"
+            label_visibility="collapsed",
+            on_change=_reset_movers_page,
         )
     
     category_filter = None if selected_category == "All" else selected_category
     
-    # Fetch movers
-    try:
-        window_seconds = window_minutes * 60
-        movers = []
-        
-        # Try cached first for standard windows
-        cached_windows = [300, 3600, 86400]
-        if window_seconds in cached_windows:
-            movers = AnalyticsQueries.get_cached_movers(
-                window_seconds=window_seconds,
-                limit=30,
-                category=category_filter,
-                direction="both"
-            )
-        
-        if not movers:
-            movers = MarketQueries.get_movers_window(
-                window_seconds=window_seconds,
-                limit=30,
-                category=category_filter,
-                direction="both"
-            )
-        
-        # Ensure volume data is available for display
-        # The queries now use v_latest_volumes which prefers WSS over Gamma
-        if movers:
-            # Log volume source for debugging
-            wss_count = sum(1 for m in movers if m.get('volume_source') == 'wss')
-            gamma_count = sum(1 for m in movers if m.get('volume_source') == 'gamma')
-            if wss_count > 0 or gamma_count > 0:
-                st.session_state['volume_debug'] = f"WSS: {wss_count}, Gamma: {gamma_count}"
-        
-        if not movers:
-            st.markdown("""
-            <div class="empty-state">
-                <div class="empty-state-icon">📭</div>
-                <p>No movers found for this timeframe and category.</p>
-                <p style="font-size: 0.85rem;">Try a different filter or wait for more data.</p>
-            </div>
-            """, unsafe_allow_html=True)
-            return
-        
-        # Show volume debug info if available
-        if 'volume_debug' in st.session_state and st.session_state['volume_debug']:
-            st.markdown(f"""
-            <div style="font-size: 0.75rem; color: var(--pm-text-muted); margin-bottom: 1rem;">
-                Volume sources: {st.session_state['volume_debug']}
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Render mover cards
-        for mover in movers:
-            render_mover_card(mover)
-            
-    except Exception as e:
-        st.error(f"Error loading movers: {e}")
+    _render_movers_list(window_minutes * 60, category_filter)
 
 
 if __name__ == "__main__":
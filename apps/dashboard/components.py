@@ -1,12 +1,17 @@
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from html import escape
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse, urlunparse
+import logging
+import re
+import time
 import uuid
 
-import pandas as pd
+import numpy as np
 import streamlit as st
-import altair as alt
 try:
     from zoneinfo import ZoneInfo
 except ImportError:
@@ -19,55 +24,164 @@ except ImportError:
     def st_javascript(js_code, key=None):
         return None
 
-from packages.core.storage.queries import WatchlistQueries, MarketQueries
+from packages.core.storage import DatabasePool, get_db_pool
+from packages.core.storage.queries import WatchlistQueries
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "FONT_LINKS",
+    "Mover",
+    "enqueue_toast",
+    "flush_toasts",
+    "format_volume",
+    "generate_reason",
+    "get_dashboard_db_pool",
+    "get_session_id",
+    "get_spike_badge",
+    "get_user_timezone",
+    "get_watchlist",
+    "init_watchlist",
+    "lttb_indices",
+    "minify_css",
+    "normalize_market_url",
+    "normalize_mover",
+    "normalize_movers",
+    "render_mover_cards_batch",
+    "render_volume_spike_alert",
+    "render_volume_spike_alerts",
+    "to_user_tz",
+    "to_user_tz_series",
+    "toggle_watchlist",
+    "update_watchlist",
+]
+
+
+# Every dashboard font in one stylesheet request. Pages emit this ahead of
+# their <style> blocks instead of a render-blocking CSS @import, and the
+# preconnect opens the font-file connection before the stylesheet arrives.
+# Leading with <link> makes markdown treat the string as an HTML block that
+# ends at the first blank line, so the CSS after it must go through minify_css.
+FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?'
+    "family=DM+Sans:wght@400;500;600;700"
+    "&family=IBM+Plex+Mono:wght@400;500;600"
+    "&family=JetBrains+Mono:wght@400;600"
+    "&family=Space+Grotesk:wght@400;500;700"
+    '&display=swap">'
+)
+
+
+def minify_css(css: str) -> str:
+    """Collapse whitespace in a <style> block so it renders as one HTML line."""
+    css = re.sub(r"\s+", " ", css).strip()
+    return re.sub(r"\s*([{};])\s*", r"\1", css)
+
+
+@st.cache_resource(show_spinner=False)
+def get_dashboard_db_pool() -> DatabasePool:
+    """Shared database pool, created once per Streamlit server process."""
+    return get_db_pool()
+
+
+# st_javascript returns 0 until the browser has evaluated the snippet
+_JS_PENDING = 0
+
+
+def _resolve_session_id(uid: str) -> str:
+    """Pin the session ID for the rest of this session."""
+    st.session_state.user_session_id = uid
+    st.session_state._uid_resolved = True
+    return uid
+
+
+_UID_KEY = "pm_movers_uid"
+
+
+# Adopts the stored localStorage ID (older sessions) or the offered one, and
+# mirrors it into a cookie so later page loads can read it server-side.
+_UID_JS = (
+    "(() => {{"
+    f"const id = localStorage.getItem('{_UID_KEY}') || '{{candidate}}';"
+    f"localStorage.setItem('{_UID_KEY}', id);"
+    f"document.cookie = '{_UID_KEY}=' + id + '; path=/; max-age=31536000; SameSite=Lax';"
+    "return id;"
+    "}})()"
+)
 
 
 def get_session_id() -> str:
-    """Get persistent session ID using localStorage or generate new."""
-    if 'user_session_id' in st.session_state:
+    """
+    Get persistent session ID from the browser or generate new.
+
+    Resolved at most once per session. The ``pm_movers_uid`` cookie is read
+    synchronously; only a browser without the cookie needs the JS round
+    trip. The ID is never taken from the URL, so shared links don't carry
+    anyone's watchlist.
+    """
+    # Pages that mint their own ID (Custom Alerts) set user_session_id directly.
+    if st.session_state.get('_uid_resolved') or 'user_session_id' in st.session_state:
         return st.session_state.user_session_id
-    
-    # Attempt to retrieve from localStorage
-    try:
-        uid_from_js = st_javascript("localStorage.getItem('pm_movers_uid')", key="get_uid_js")
-    except Exception:
-        uid_from_js = None
 
-    if uid_from_js:
-        st.session_state.user_session_id = uid_from_js
-        return uid_from_js
-        
-    # If not found or not yet returned, generate new one to use immediately
+    cookies = getattr(st.context, "cookies", None) or {}
+    uid_from_cookie = cookies.get(_UID_KEY)
+    if uid_from_cookie:
+        return _resolve_session_id(uid_from_cookie)
+
     if 'temp_uid' not in st.session_state:
         st.session_state.temp_uid = str(uuid.uuid4())
-    
-    # We return the temp UID but also try to save it. 
-    # If the user refreshes, they might get the saved one.
-    uid = st.session_state.temp_uid
-    st.session_state.user_session_id = uid
-    
+
     try:
-        st_javascript(f"localStorage.setItem('pm_movers_uid', '{uid}')", key="set_uid_js")
+        uid_from_js = st_javascript(
+            _UID_JS.format(candidate=st.session_state.temp_uid), key="get_uid_js"
+        )
     except Exception:
-        pass
-        
-    return uid
+        uid_from_js = _JS_PENDING
+
+    if uid_from_js == _JS_PENDING:
+        # Browser hasn't answered yet; use the temp UID for this run only.
+        return st.session_state.temp_uid
+
+    # Without the JS bridge the temp UID becomes this session's ID.
+    return _resolve_session_id(uid_from_js or st.session_state.temp_uid)
 
 
 def get_user_timezone() -> str:
-    """Get the user's timezone from the browser."""
-    if 'user_timezone' in st.session_state:
+    """Get the user's timezone from the browser, resolved once per session."""
+    if st.session_state.get('_tz_resolved'):
         return st.session_state.user_timezone
-        
-    try:
-        tz = st_javascript("Intl.DateTimeFormat().resolvedOptions().timeZone", key="get_tz_js")
-        if tz:
-            st.session_state.user_timezone = tz
-            return tz
-    except Exception:
-        pass
-        
-    return "UTC"
+
+    # Newer Streamlit versions report the browser timezone with the session,
+    # which avoids a JS round trip entirely.
+    tz = getattr(st.context, "timezone", None)
+    if not tz:
+        try:
+            tz = st_javascript("Intl.DateTimeFormat().resolvedOptions().timeZone", key="get_tz_js")
+        except Exception:
+            tz = None
+        if tz == _JS_PENDING:
+            return "UTC"
+
+    # Cache whatever we got, UTC included, so later runs skip the lookup.
+    st.session_state.user_timezone = tz or "UTC"
+    st.session_state._tz_resolved = True
+    return st.session_state.user_timezone
+
+
+_UTC = ZoneInfo("UTC")
+
+
+# Unbounded: the module is shared by every session and the key space is the
+# IANA zone list, so a small LRU would evict and rebuild zones between users.
+@lru_cache(maxsize=None)
+def _zone(name: str) -> ZoneInfo:
+    """Resolve an IANA timezone name once per process."""
+    return ZoneInfo(name)
 
 
 def to_user_tz(dt: datetime) -> datetime:
@@ -77,59 +191,186 @@ def to_user_tz(dt: datetime) -> datetime:
         
     # Ensure dt is timezone-aware and in UTC
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+        dt = dt.replace(tzinfo=_UTC)
     
     user_tz = get_user_timezone()
+    if user_tz == "UTC" and dt.tzinfo is _UTC:
+        return dt
     try:
-        return dt.astimezone(ZoneInfo(user_tz))
+        return dt.astimezone(_zone(user_tz))
     except Exception:
         return dt # Fallback
 
 
+def to_user_tz_series(ts: "pd.Series") -> "pd.Series":
+    """Vectorized to_user_tz for a column of timestamps (naive values are UTC)."""
+    # Deferred so pages that never chart timestamps don't pay for pandas
+    import pandas as pd
+
+    series = pd.to_datetime(ts, utc=True)
+    user_tz = get_user_timezone()
+    if user_tz == "UTC":
+        return series
+    try:
+        return series.dt.tz_convert(_zone(user_tz))
+    except Exception:
+        return series
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of at most `n_out` points that keep the visual shape
+    of the (x, y) series; the first and last points are always kept. `x`
+    must be sorted ascending.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    anchor = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        area = np.abs(
+            (x[anchor] - next_x) * (y[start:end] - y[anchor])
+            - (x[anchor] - x[start:end]) * (next_y - y[anchor])
+        )
+        anchor = start + int(area.argmax())
+        indices[i + 1] = anchor
+    return indices
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_watchlist_cached(uid: str) -> list[dict]:
+    """Watchlist rows for a session ID (cached for 60s, cleared after each write)."""
+    return WatchlistQueries.get_all(uid)
+
+
+def _write_watchlist(write, uid: str, *args) -> bool:
+    """
+    Run a WatchlistQueries write for ``uid`` and drop that session's cached rows.
+
+    On failure the error is logged and an error toast is queued; callers
+    leave session state untouched so the UI keeps matching the database.
+    """
+    try:
+        write(uid, *args)
+    except Exception as e:
+        logger.error(f"Watchlist write failed: {e}")
+        enqueue_toast("Couldn't update watchlist, please try again", icon="⚠️")
+        return False
+    finally:
+        # Other sessions' entries stay warm; only this watchlist changed.
+        _get_watchlist_cached.clear(uid)
+    return True
+
+
 def init_watchlist():
     """Initialize watchlist from database using session ID."""
     if 'watchlist_initialized' not in st.session_state:
         uid = get_session_id()
+        if st.session_state.get('watchlist_uid') == uid:
+            return
         # Trigger timezone fetch early
         get_user_timezone() 
         
         # Load from DB
-        items = WatchlistQueries.get_all(uid)
+        try:
+            items = _get_watchlist_cached(uid)
+        except Exception as e:
+            # Show an empty watchlist for now; the load is retried next run.
+            logger.error(f"Failed to load watchlist: {e}")
+            st.session_state.watchlist = {}
+            st.session_state.watchlist_ids = frozenset()
+            return
         st.session_state.watchlist = {
             str(item['market_id']): item for item in items
         }
-        st.session_state.watchlist_initialized = True
+        st.session_state.watchlist_ids = frozenset(st.session_state.watchlist)
+        st.session_state.watchlist_uid = uid
+        # Until the browser returns the persistent session ID we are loading
+        # for a temp UID; reload once the real one arrives.
+        if 'user_session_id' in st.session_state:
+            st.session_state.watchlist_initialized = True
+
 
+def toggle_watchlist(market_id: str, title: str, source: str) -> Optional[bool]:
+    """
+    Toggle a market in/out of the watchlist backed by DB.
 
-def toggle_watchlist(market_id: str, title: str, source: str) -> bool:
-    """Toggle a market in/out of the watchlist backed by DB."""
+    Returns True if added, False if removed, or None if the write failed.
+    """
     init_watchlist()
     uid = get_session_id()
     
     if market_id in st.session_state.watchlist:
         # Remove
-        WatchlistQueries.remove(uid, market_id)
+        if not _write_watchlist(WatchlistQueries.remove, uid, market_id):
+            return None
         if market_id in st.session_state.watchlist:
             del st.session_state.watchlist[market_id]
+        st.session_state.watchlist_ids = st.session_state.watchlist_ids - {market_id}
         return False
     else:
         # Add
-        WatchlistQueries.add(uid, market_id)
+        if not _write_watchlist(WatchlistQueries.add, uid, market_id):
+            return None
         st.session_state.watchlist[market_id] = {
             'title': title,
             'source': source,
-            'added_at': datetime.now().isoformat()
+            'added_at': time.time_ns(),  # epoch ns; DB rows carry a datetime
         }
+        st.session_state.watchlist_ids = st.session_state.watchlist_ids | {market_id}
         return True
 
 
-def is_in_watchlist(market_id: str) -> bool:
-    """Check if a market is in the watchlist."""
-    try:
-        init_watchlist()
-        return market_id in st.session_state.watchlist
-    except Exception:
+def update_watchlist(add: dict[str, tuple[str, str]], remove: list[str]) -> bool:
+    """
+    Apply several watchlist changes at once with a single DB write.
+
+    ``add`` maps market_id to (title, source); ``remove`` lists market IDs.
+    Returns False if the write failed.
+    """
+    if not add and not remove:
+        return True
+    init_watchlist()
+    uid = get_session_id()
+    if not _write_watchlist(WatchlistQueries.bulk_update, uid, list(add), list(remove)):
         return False
+    watchlist = st.session_state.watchlist
+    for market_id in remove:
+        watchlist.pop(market_id, None)
+    for market_id, (title, source) in add.items():
+        watchlist[market_id] = {
+            'title': title,
+            'source': source,
+            'added_at': time.time_ns(),  # epoch ns; DB rows carry a datetime
+        }
+    st.session_state.watchlist_ids = frozenset(watchlist)
+    return True
+
+
+def enqueue_toast(message: str, icon: Optional[str] = None) -> None:
+    """Queue a toast to show on the next run, so it survives a following st.rerun()."""
+    st.session_state.setdefault("_pending_toasts", []).append((message, icon))
+
+
+def flush_toasts() -> None:
+    """Show and clear any toasts queued by enqueue_toast."""
+    for message, icon in st.session_state.pop("_pending_toasts", ()):
+        st.toast(message, icon=icon)
 
 
 def get_watchlist() -> dict:
@@ -138,14 +379,23 @@ def get_watchlist() -> dict:
     return st.session_state.watchlist
 
 
+# (threshold, divisor, suffix) checked from the largest magnitude down
+_VOLUME_MAGNITUDES = (
+    (1_000_000_000, 1_000_000_000, "B"),
+    (1_000_000, 1_000_000, "M"),
+    (1_000, 1_000, "k"),
+)
+
+
 def format_volume(volume: float) -> str:
     """Format volume as human-readable string."""
-    if volume >= 1_000_000:
-        return f"${volume/1_000_000:.1f}M"
-    elif volume >= 1_000:
-        return f"${volume/1_000:.1f}k"
-    else:
+    if volume < 1_000:
+        # Most thin markets land here; skip the magnitude scan entirely.
         return f"${volume:.0f}"
+    for threshold, divisor, suffix in _VOLUME_MAGNITUDES:
+        if volume >= threshold:
+            return f"${volume / divisor:.1f}{suffix}"
+    return f"${volume:.0f}"
 
 
 def normalize_market_url(market_url: Optional[str], source: Optional[str] = None) -> Optional[str]:
@@ -194,85 +444,232 @@ def normalize_market_url(market_url: Optional[str], source: Optional[str] = None
     return None
 
 
-def get_spike_badge(spike_ratio: Optional[float]) -> str:
-    """Generate HTML badge for volume spike indicator."""
-    if spike_ratio is None or spike_ratio < 1.5:
-        return ""
+@dataclass(frozen=True, slots=True)
+class _Color:
+    """A color with its preformatted translucent background, so cards never parse hex."""
 
-    if spike_ratio >= 10:
-        color = "#ff4757"  # Red - extreme
-        label = f"🔥 {spike_ratio:.1f}x VOL"
-    elif spike_ratio >= 5:
-        color = "#ffa502"  # Orange - high
-        label = f"🔥 {spike_ratio:.1f}x VOL"
-    elif spike_ratio >= 3:
-        color = "#fbbf24"  # Yellow - medium
-        label = f"📈 {spike_ratio:.1f}x VOL"
-    else:
-        color = "#71717a"  # Gray - low
-        label = f"↑ {spike_ratio:.1f}x vol"
+    hex: str
+    bg: str
+
+
+# Volume spike severity palette, shared by the badges and the alert cards
+_SEVERITY_COLORS = {
+    "low": _Color("#71717a", "rgba(113, 113, 122, 0.2)"),
+    "medium": _Color("#fbbf24", "rgba(251, 191, 36, 0.2)"),
+    "high": _Color("#ffa502", "rgba(255, 165, 2, 0.2)"),
+    "extreme": _Color("#ff4757", "rgba(255, 71, 87, 0.2)"),
+}
 
-    return f'<span style="display: inline-block; padding: 0.15rem 0.5rem; border-radius: 4px; font-size: 0.7rem; font-weight: 600; margin-left: 0.5rem; background: rgba({_hex_to_rgb(color)}, 0.2); color: {color};">{label}</span>'
 
+_SPIKE_BADGE_TEMPLATE = '<span style="display: inline-block; padding: 0.15rem 0.5rem; border-radius: 4px; font-size: 0.7rem; font-weight: 600; margin-left: 0.5rem; background: {bg}; color: {color};">{label}</span>'
 
-def _hex_to_rgb(hex_color: str) -> str:
-    """Convert hex color to RGB string for rgba()."""
-    hex_color = hex_color.lstrip('#')
-    r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-    return f"{r}, {g}, {b}"
+
+# (min ratio, color, label format) from the lowest tier up
+_SPIKE_TIERS = (
+    (1.5, _SEVERITY_COLORS["low"], "↑ {:.1f}x vol"),  # Gray
+    (3.0, _SEVERITY_COLORS["medium"], "📈 {:.1f}x VOL"),  # Yellow
+    (5.0, _SEVERITY_COLORS["high"], "🔥 {:.1f}x VOL"),  # Orange
+    (10.0, _SEVERITY_COLORS["extreme"], "🔥 {:.1f}x VOL"),  # Red
+)
+_SPIKE_THRESHOLDS = tuple(threshold for threshold, _, _ in _SPIKE_TIERS)
+# Full badge markup per tier; only the ratio is filled in per call
+_SPIKE_BADGES = tuple(
+    _SPIKE_BADGE_TEMPLATE.format(bg=color.bg, color=color.hex, label=label_fmt)
+    for _, color, label_fmt in _SPIKE_TIERS
+)
+
+
+def get_spike_badge(spike_ratio: Optional[float]) -> str:
+    """Generate HTML badge for volume spike indicator."""
+    if spike_ratio is None:
+        return ""
+
+    tier = bisect_right(_SPIKE_THRESHOLDS, spike_ratio) - 1
+    if tier < 0:
+        return ""
+    return _SPIKE_BADGES[tier].format(spike_ratio)
 
 
 def generate_reason(pct_change: float, volume: float, outcome: str, spike_ratio: Optional[float] = None, use_html: bool = True) -> str:
-    """Generate a readable reason for the move."""
-    direction = "spiked" if pct_change > 0 else "dropped"
-    abs_pp = abs(pct_change)
+    """
+    Generate a readable reason for the move.
+
+    Inputs are reduced to what the text shows (0.1pp, the formatted volume,
+    0.1x spike) before the cache lookup, so live rows share entries.
+    """
+    spike = round(spike_ratio, 1) if spike_ratio and spike_ratio >= 2.0 else None
+    return _generate_reason_cached(
+        pct_change > 0, round(abs(pct_change), 1), format_volume(volume), outcome, spike, use_html
+    )
 
-    vol_str = format_volume(volume)
+
+@lru_cache(maxsize=2048)
+def _generate_reason_cached(
+    rising: bool, abs_pp: float, vol_str: str, outcome: str, spike_ratio: Optional[float], use_html: bool
+) -> str:
+    direction = "spiked" if rising else "dropped"
 
     if use_html:
-        reason = f"<strong>{outcome}</strong> {direction} <strong>{abs_pp:.1f}pp</strong> on {vol_str} vol"
-        if spike_ratio and spike_ratio >= 2.0:
-            reason += f" (<strong>{spike_ratio:.1f}x</strong> normal)"
+        parts = [f"<strong>{outcome}</strong> {direction} <strong>{abs_pp:.1f}pp</strong> on {vol_str} vol"]
+        if spike_ratio is not None:
+            parts.append(f" (<strong>{spike_ratio:.1f}x</strong> normal)")
     else:
-        reason = f"**{outcome}** {direction} **{abs_pp:.1f}pp** on {vol_str} vol"
-        if spike_ratio and spike_ratio >= 2.0:
-            reason += f" (**{spike_ratio:.1f}x** normal)"
+        parts = [f"**{outcome}** {direction} **{abs_pp:.1f}pp** on {vol_str} vol"]
+        if spike_ratio is not None:
+            parts.append(f" (**{spike_ratio:.1f}x** normal)")
+
+    return "".join(parts)
+
+
+# Theme-aware card colors
+_PALETTE_DARK = {
+    "card_bg": "linear-gradient(135deg, #12121a 0%, #1a1a24 100%)",
+    "card_border": "#2a2a3a",
+    "title_color": "#e4e4e7",
+    "muted_color": "#71717a",
+    "secondary_color": "#a1a1aa",
+}
+_PALETTE_LIGHT = {
+    "card_bg": "#ffffff",
+    "card_border": "#e4e4e7",
+    "title_color": "#18181b",
+    "muted_color": "#71717a",
+    "secondary_color": "#52525b",
+}
+
+
+def _get_palette(dark_mode: bool) -> dict:
+    """Card colors for the current theme (shared dicts; do not mutate)."""
+    return _PALETTE_DARK if dark_mode else _PALETTE_LIGHT
+
+
+_CARD_LINK_TEMPLATE = '<a class="pmm-link" href="{url}" target="_blank" rel="noopener noreferrer">View market →</a>'
+
+
+def _minify_html(template: str) -> str:
+    """Drop the newlines and indentation between tags in a card template."""
+    return re.sub(r"\n\s*", "", template)
+
+
+def _palette_vars(palette: dict) -> str:
+    """CSS custom properties (--pmm-card-bg, ...) for a palette."""
+    return ";".join(f"--pmm-{name.replace('_', '-')}:{value}" for name, value in palette.items())
+
+
+# Static mover-card styling, shipped once per render ahead of the cards. The
+# theme only switches the custom properties on the wrapping element.
+_MOVER_CARD_CSS = _minify_html(f"""<style>
+  .pmm-dark {{{_palette_vars(_PALETTE_DARK)}}}
+  .pmm-light {{{_palette_vars(_PALETTE_LIGHT)}}}
+  .pmm-card {{background: var(--pmm-card-bg); border: 1px solid var(--pmm-card-border); border-radius: 12px; padding: 1.25rem; margin-bottom: 0.5rem; display: flex; justify-content: space-between; align-items: flex-start;}}
+  .pmm-main {{flex: 1;}}
+  .pmm-tags {{margin-bottom: 0.5rem;}}
+  .pmm-tag {{display: inline-block; padding: 0.15rem 0.5rem; border-radius: 4px; font-size: 0.7rem; font-weight: 600;}}
+  .pmm-source {{text-transform: uppercase; background: rgba(99, 102, 241, 0.15); color: #6366f1;}}
+  .pmm-yes, .pmm-no {{margin-left: 0.5rem;}}
+  .pmm-yes {{background: rgba(16, 185, 129, 0.12); color: #10b981;}}
+  .pmm-no {{background: rgba(239, 68, 68, 0.12); color: #ef4444;}}
+  .pmm-title {{font-family: system-ui, sans-serif; font-size: 1rem; font-weight: 500; color: var(--pmm-title-color); margin: 0 0 0.5rem 0; line-height: 1.4;}}
+  .pmm-link {{display: inline-block; font-size: 0.8rem; color: #6366f1; text-decoration: none; margin-bottom: 0.25rem;}}
+  .pmm-prices {{font-family: monospace; font-size: 0.85rem; color: var(--pmm-muted-color); margin: 0;}}
+  .pmm-reason {{margin-top: 0.5rem; font-size: 0.85rem; color: var(--pmm-secondary-color);}}
+  .pmm-stale {{display: inline-block; margin-left: 0.4rem; font-size: 0.72rem; color: #a1a1aa;}}
+  .pmm-side {{text-align: right;}}
+  .pmm-change {{font-family: monospace; font-size: 1.5rem; font-weight: 600; margin: 0;}}
+  .pmm-up {{color: #10b981;}}
+  .pmm-down {{color: #ef4444;}}
+  .pmm-category {{font-size: 0.75rem; color: var(--pmm-muted-color); margin: 0.25rem 0 0 0;}}
+</style>""")
+
+
+_CARD_TEMPLATE = _minify_html("""<div class="pmm-card">
+  <div class="pmm-main">
+    <div class="pmm-tags"><span class="pmm-tag pmm-source">{source_label}</span><span class="pmm-tag pmm-{outcome_class}">{outcome_label}</span>{spike_badge}</div>
+    <p class="pmm-title">{title_html}</p>
+    {link_html}
+    <p class="pmm-prices">${old_price:.2f} → ${latest_price:.2f}</p>
+    <div class="pmm-reason">📊 {reason}</div>
+  </div>
+  <div class="pmm-side">
+    <p class="pmm-change pmm-{direction}">{change_sign}{pct_change:.1f}pp</p>
+    <p class="pmm-category">{category_html}</p>
+  </div>
+</div>""")
 
-    return reason
 
+def _optional_float(value) -> Optional[float]:
+    """Parse a nullable numeric field, mapping bad values to None."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
-def render_mover_card(mover: dict, show_watchlist: bool = True) -> None:
-    """Render a single mover card with optional watchlist button and volume spike indicator."""
-    pct_change = float(mover.get("pct_change") or mover.get("move_pp") or 0)
-    change_sign = "+" if pct_change > 0 else ""
 
-    source = str(mover.get("source") or "unknown")
-    source_label = escape(source)
-    outcome = str(mover.get("outcome") or "YES")
-    outcome_label = escape(outcome)
+@dataclass(frozen=True, slots=True)
+class Mover:
+    """A mover row with canonical field names, normalized once at the fetch boundary."""
 
-    latest_price = float(mover.get("latest_price") or mover.get("price_now") or 0)
-    old_price = float(mover.get("old_price") or mover.get("price_then") or 0)
+    market_id: str
+    title: str
+    source: str
+    outcome: str
+    category: str
+    url: str
+    pct_change: float
+    latest_price: float
+    old_price: float
+    volume: float
+    spike_ratio: Optional[float]
+    stale_volume: bool
+    stale_age_seconds: Optional[float]
 
+
+def normalize_mover(raw: dict) -> Mover:
+    """Resolve the alternate column names used by the movers queries into a Mover."""
     # Prefer display_volume when present (used by 5m stale-volume UI fallback).
-    raw_volume = mover.get("display_volume")
+    raw_volume = raw.get("display_volume")
     if raw_volume is None:
         raw_volume = (
-            mover.get("latest_volume")
-            or mover.get("current_volume")
-            or mover.get("volume_24h")
+            raw.get("latest_volume")
+            or raw.get("current_volume")
+            or raw.get("volume_24h")
             or 0
         )
-    volume = float(raw_volume or 0)
-    stale_volume = bool(mover.get("display_volume_is_stale"))
-    stale_age_seconds = mover.get("display_volume_age_seconds")
+    return Mover(
+        market_id=str(raw.get("market_id") or ""),
+        title=str(raw.get("title") or ""),
+        source=str(raw.get("source") or "unknown"),
+        outcome=str(raw.get("outcome") or "YES"),
+        category=str(raw.get("category") or "Uncategorized"),
+        url=str(raw.get("url") or raw.get("market_url") or ""),
+        pct_change=float(raw.get("pct_change") or raw.get("move_pp") or 0),
+        latest_price=float(raw.get("latest_price") or raw.get("price_now") or 0),
+        old_price=float(raw.get("old_price") or raw.get("price_then") or 0),
+        volume=float(raw_volume or 0),
+        spike_ratio=_optional_float(raw.get("volume_spike_ratio")),
+        stale_volume=bool(raw.get("display_volume_is_stale")),
+        stale_age_seconds=_optional_float(raw.get("display_volume_age_seconds")),
+    )
+
+
+def normalize_movers(rows: list[dict]) -> list[Mover]:
+    """Normalize a list of mover rows; see normalize_mover."""
+    return [normalize_mover(row) for row in rows]
+
+
+def _mover_card_fields(mover: Mover) -> dict:
+    """Compute the _CARD_TEMPLATE substitutions for a mover."""
+    pct_change = mover.pct_change
+    change_sign = "+" if pct_change > 0 else ""
+    source = mover.source
+    outcome = mover.outcome
+
     stale_volume_note = ""
-    if stale_volume:
+    if mover.stale_volume:
         age_label = ""
-        try:
-            age_seconds = float(stale_age_seconds) if stale_age_seconds is not None else None
-        except (TypeError, ValueError):
-            age_seconds = None
+        age_seconds = mover.stale_age_seconds
         if age_seconds is not None:
             if age_seconds >= 3600:
                 age_label = f" ({age_seconds / 3600:.1f}h old)"
@@ -280,104 +677,160 @@ def render_mover_card(mover: dict, show_watchlist: bool = True) -> None:
                 age_label = f" ({age_seconds / 60:.0f}m old)"
             else:
                 age_label = f" ({age_seconds:.0f}s old)"
-        stale_volume_note = (
-            f'<span style="display: inline-block; margin-left: 0.4rem; '
-            f'font-size: 0.72rem; color: #a1a1aa;">stale volume{age_label}</span>'
-        )
-
-    # Get volume spike ratio if available
-    spike_ratio = mover.get("volume_spike_ratio")
-    if spike_ratio is not None:
-        try:
-            spike_ratio = float(spike_ratio)
-        except (ValueError, TypeError):
-            spike_ratio = None
+        stale_volume_note = f'<span class="pmm-stale">stale volume{age_label}</span>'
 
     # Generate reason with spike context (HTML format)
-    reason = generate_reason(pct_change, volume, outcome, spike_ratio, use_html=True)
+    reason_parts = [generate_reason(pct_change, mover.volume, outcome, mover.spike_ratio, use_html=True)]
     if stale_volume_note:
-        reason += f" {stale_volume_note}"
+        reason_parts.append(stale_volume_note)
 
-    # Get spike badge HTML
-    spike_badge = get_spike_badge(spike_ratio)
+    title = mover.title or "Unknown Market"
+    market_url = normalize_market_url(mover.url or None, source=source)
 
-    market_id = str(mover.get("market_id", ""))
-    title = str(mover.get("title") or "Unknown Market")
-    title_html = escape(title)
-    market_url = normalize_market_url(
-        mover.get("url") or mover.get("market_url"),
-        source=source,
-    )
-    category = str(mover.get("category") or "Uncategorized")
-    category_html = escape(category)
-    
-    # Check if in watchlist
-    in_watchlist = is_in_watchlist(market_id) if market_id else False
-    star_icon = "★" if in_watchlist else "☆"
+    link_html = ""
+    if market_url:
+        link_html = _CARD_LINK_TEMPLATE.format(url=escape(market_url, quote=True))
+
+    return {
+        "source_label": escape(source),
+        "outcome_label": escape(outcome),
+        "outcome_class": "yes" if outcome == "YES" else "no",
+        "spike_badge": get_spike_badge(mover.spike_ratio),
+        "title_html": escape(title),
+        "link_html": link_html,
+        "old_price": mover.old_price,
+        "latest_price": mover.latest_price,
+        "reason": " ".join(reason_parts),
+        "direction": "up" if pct_change > 0 else "down",
+        "change_sign": change_sign,
+        "pct_change": pct_change,
+        "category_html": escape(mover.category),
+    }
 
-    # Theme-aware colors
-    dark_mode = st.session_state.get("dark_mode", False)
-    
-    if dark_mode:
-        card_bg = "linear-gradient(135deg, #12121a 0%, #1a1a24 100%)"
-        card_border = "#2a2a3a"
-        title_color = "#e4e4e7"
-        muted_color = "#71717a"
-        secondary_color = "#a1a1aa"
-    else:
-        card_bg = "#ffffff"
-        card_border = "#e4e4e7"
-        title_color = "#18181b"
-        muted_color = "#71717a"
-        secondary_color = "#52525b"
 
-    # Determine colors based on outcome and change (these stay consistent)
-    outcome_bg = "rgba(16, 185, 129, 0.12)" if outcome == "YES" else "rgba(239, 68, 68, 0.12)"
-    outcome_color = "#10b981" if outcome == "YES" else "#ef4444"
-    change_color = "#10b981" if pct_change > 0 else "#ef4444"
+@lru_cache(maxsize=512)
+def _mover_card_html(mover: Mover) -> str:
+    """Card HTML for a mover; unchanged rows are served from cache across reruns."""
+    return _CARD_TEMPLATE.format_map(_mover_card_fields(mover))
 
-    link_html = ""
-    if market_url:
-        safe_url = escape(market_url, quote=True)
-        link_html = (
-            f'<a href="{safe_url}" target="_blank" rel="noopener noreferrer" '
-            f'style="display: inline-block; font-size: 0.8rem; color: #6366f1; '
-            f'text-decoration: none; margin-bottom: 0.25rem;">View market →</a>'
-        )
 
-    # Build HTML string with proper structure
-    html_content = f"""<div style="background: {card_bg}; border: 1px solid {card_border}; border-radius: 12px; padding: 1.25rem; margin-bottom: 0.5rem;">
-  <div style="display: flex; justify-content: space-between; align-items: flex-start;">
-    <div style="flex: 1;">
-      <div style="margin-bottom: 0.5rem;">
-        <span style="display: inline-block; padding: 0.15rem 0.5rem; border-radius: 4px; font-size: 0.7rem; font-weight: 600; text-transform: uppercase; background: rgba(99, 102, 241, 0.15); color: #6366f1;">{source_label}</span>
-        <span style="display: inline-block; padding: 0.15rem 0.5rem; border-radius: 4px; font-size: 0.7rem; font-weight: 600; margin-left: 0.5rem; background: {outcome_bg}; color: {outcome_color};">{outcome_label}</span>
-        {spike_badge}
-      </div>
-      <p style="font-family: system-ui, sans-serif; font-size: 1rem; font-weight: 500; color: {title_color}; margin: 0 0 0.5rem 0; line-height: 1.4;">{title_html}</p>
-      {link_html}
-      <p style="font-family: monospace; font-size: 0.85rem; color: {muted_color}; margin: 0;">${old_price:.2f} → ${latest_price:.2f}</p>
-      <div style="margin-top: 0.5rem; font-size: 0.85rem; color: {secondary_color};">📊 {reason}</div>
+def _current_watchlist_ids() -> frozenset:
+    """Load the watchlist once and return its market ids."""
+    init_watchlist()
+    return st.session_state.get("watchlist_ids") or frozenset()
+
+
+# Responsive grid wrapping a batch of cards; columns collapse to one on narrow layouts
+_CARD_GRID_TEMPLATE = (
+    '<div class="pmm-{theme}" style="display: grid; grid-template-columns: repeat(auto-fill, minmax(360px, 1fr)); '
+    'column-gap: 0.5rem;">{cards}</div>'
+)
+
+
+def _card_theme() -> str:
+    """Theme class suffix for the card wrapper."""
+    return "dark" if st.session_state.get("dark_mode", False) else "light"
+
+
+def render_mover_cards_batch(
+    movers: list[Mover | dict],
+    show_watchlist: bool = True,
+    form_key: str = "watchlist_bulk",
+    watchlist_ids: Optional[frozenset] = None,
+) -> None:
+    """
+    Render a list of mover cards as one CSS grid with a single st.html call.
+
+    Watchlist toggles are widgets, so they follow in a second pass: one
+    checkbox per market inside a form keyed by ``form_key``.
+    """
+    if not movers:
+        return
+    movers = [normalize_mover(mover) if isinstance(mover, dict) else mover for mover in movers]
+    cards = "".join(_mover_card_html(mover) for mover in movers)
+    st.html(_MOVER_CARD_CSS + _CARD_GRID_TEMPLATE.format(theme=_card_theme(), cards=cards))
+
+    if show_watchlist:
+        if watchlist_ids is None:
+            watchlist_ids = _current_watchlist_ids()
+        _render_watchlist_form(movers, form_key, watchlist_ids)
+
+
+def _submit_watchlist_form(form_key: str, markets: dict[str, Mover]) -> None:
+    """
+    Form submit callback: write the toggled markets in one update.
+
+    Runs before the rerun, so on a failed write the checkbox states can be
+    dropped and the form redraws from the stored watchlist.
+    """
+    watchlist_ids = st.session_state.get("watchlist_ids") or frozenset()
+    checked = {market_id: st.session_state.get(f"{form_key}_{market_id}", False) for market_id in markets}
+    add = {
+        market_id: (markets[market_id].title or "Unknown Market", markets[market_id].source)
+        for market_id, keep in checked.items()
+        if keep and market_id not in watchlist_ids
+    }
+    remove = [market_id for market_id, keep in checked.items() if not keep and market_id in watchlist_ids]
+    if not add and not remove:
+        return
+    if update_watchlist(add, remove):
+        enqueue_toast(f"Watchlist updated (+{len(add)} / -{len(remove)})", icon="⭐")
+    else:
+        for market_id in markets:
+            st.session_state.pop(f"{form_key}_{market_id}", None)
+
+
+@st.fragment
+def _render_watchlist_form(movers: list[Mover], form_key: str, watchlist_ids: frozenset) -> None:
+    """
+    One checkbox per market and a single submit, so several toggles cost one rerun.
+
+    Runs as a fragment: submitting reruns the form alone, not the page's
+    movers query, filters and card grid.
+    """
+    flush_toasts()
+    # Fragment reruns reuse the original arguments; read the live set instead.
+    watchlist_ids = st.session_state.get("watchlist_ids", watchlist_ids)
+    # A market can appear once per outcome; its watchlist entry is per market.
+    markets: dict[str, Mover] = {}
+    for mover in movers:
+        if mover.market_id:
+            markets.setdefault(mover.market_id, mover)
+    if not markets:
+        return
+    with st.expander("⭐ Watchlist", expanded=False):
+        with st.form(form_key, clear_on_submit=False, border=False):
+            for market_id, mover in markets.items():
+                st.checkbox(
+                    (mover.title or "Unknown Market")[:80],
+                    value=market_id in watchlist_ids,
+                    key=f"{form_key}_{market_id}",
+                )
+            st.form_submit_button(
+                "Update watchlist",
+                width="stretch",
+                on_click=_submit_watchlist_form,
+                args=(form_key, markets),
+            )
+
+
+_SPIKE_ALERT_TEMPLATE = _minify_html("""<div style="background: {card_bg}; border: 1px solid {color}; border-radius: 12px; padding: 1rem; margin-bottom: 0.5rem;">
+  <div style="display: flex; justify-content: space-between; align-items: center;">
+    <div>
+      <span style="display: inline-block; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem; font-weight: 600; text-transform: uppercase; background: {bg}; color: {color};">🔥 {severity_label} VOLUME SPIKE</span>
+      <p style="font-family: system-ui, sans-serif; font-size: 0.95rem; font-weight: 500; color: {title_color}; margin: 0.5rem 0 0.25rem 0;">{title}{outcome_suffix}</p>
+      <p style="font-family: monospace; font-size: 0.8rem; color: {muted_color};">{current_volume} volume (avg {avg_volume}){price_suffix}</p>
     </div>
     <div style="text-align: right;">
-      <p style="font-family: monospace; font-size: 1.5rem; font-weight: 600; color: {change_color}; margin: 0;">{change_sign}{pct_change:.1f}pp</p>
-      <p style="font-size: 0.75rem; color: {muted_color}; margin: 0.25rem 0 0 0;">{category_html}</p>
+      <p style="font-family: monospace; font-size: 1.5rem; font-weight: 600; color: {color}; margin: 0;">{spike_ratio:.1f}x</p>
+      <p style="font-size: 0.75rem; color: {muted_color}; margin: 0;">normal volume</p>
     </div>
   </div>
-</div>"""
-    
-    st.html(html_content)
+</div>""")
 
-    # Render watchlist button below the card (Streamlit button)
-    if show_watchlist and market_id:
-        btn_label = f"{star_icon} {'Remove from' if in_watchlist else 'Add to'} Watchlist"
-        if st.button(btn_label, key=f"watch_{market_id}_{outcome}", width="stretch"):
-            toggle_watchlist(market_id, title, source)
-            st.rerun()
 
-
-def render_volume_spike_alert(spike: dict) -> None:
-    """Render a volume spike alert card."""
+def _spike_alert_html(spike: dict, dark_mode: bool) -> str:
+    """Build the HTML for one volume spike alert card."""
     title = spike.get("title", "Unknown Market")
     outcome = spike.get("outcome", "")
     spike_ratio = float(spike.get("spike_ratio", 0))
@@ -388,52 +841,44 @@ def render_volume_spike_alert(spike: dict) -> None:
     price_change = spike.get("price_change_1h")
 
     # Color by severity
-    severity_colors = {
-        "low": "#71717a",
-        "medium": "#fbbf24",
-        "high": "#ffa502",
-        "extreme": "#ff4757",
-    }
-    color = severity_colors.get(severity, "#fbbf24")
+    color = _SEVERITY_COLORS.get(severity, _SEVERITY_COLORS["medium"])
 
     # Price change display
-    price_str = ""
+    price_parts = []
     if current_price:
-        price_str = f"${float(current_price):.2f}"
+        price_parts.append(f"${float(current_price):.2f}")
     if price_change:
         pc = float(price_change)
         sign = "+" if pc > 0 else ""
-        price_str += f" ({sign}{pc:.1f}%)"
+        price_parts.append(f"({sign}{pc:.1f}%)")
+    price_str = " ".join(price_parts)
 
     # Build outcome suffix
     outcome_suffix = f" ({outcome})" if outcome else ""
     price_suffix = f" | {price_str}" if price_str else ""
-    rgb = _hex_to_rgb(color)
-    
-    # Theme-aware colors
-    dark_mode = st.session_state.get("dark_mode", False)
-    
-    if dark_mode:
-        card_bg = "linear-gradient(135deg, #12121a 0%, #1a1a24 100%)"
-        title_color = "#e4e4e7"
-        muted_color = "#71717a"
-    else:
-        card_bg = "#ffffff"
-        title_color = "#18181b"
-        muted_color = "#71717a"
-    
-    html_content = f"""<div style="background: {card_bg}; border: 1px solid {color}; border-radius: 12px; padding: 1rem; margin-bottom: 0.5rem;">
-  <div style="display: flex; justify-content: space-between; align-items: center;">
-    <div>
-      <span style="display: inline-block; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem; font-weight: 600; text-transform: uppercase; background: rgba({rgb}, 0.2); color: {color};">🔥 {severity.upper()} VOLUME SPIKE</span>
-      <p style="font-family: system-ui, sans-serif; font-size: 0.95rem; font-weight: 500; color: {title_color}; margin: 0.5rem 0 0.25rem 0;">{title}{outcome_suffix}</p>
-      <p style="font-family: monospace; font-size: 0.8rem; color: {muted_color};">{format_volume(current_volume)} volume (avg {format_volume(avg_volume)}){price_suffix}</p>
-    </div>
-    <div style="text-align: right;">
-      <p style="font-family: monospace; font-size: 1.5rem; font-weight: 600; color: {color}; margin: 0;">{spike_ratio:.1f}x</p>
-      <p style="font-size: 0.75rem; color: {muted_color}; margin: 0;">normal volume</p>
-    </div>
-  </div>
-</div>"""
 
-    st.html(html_content)
+    return _SPIKE_ALERT_TEMPLATE.format_map({
+        **_get_palette(dark_mode),
+        "color": color.hex,
+        "bg": color.bg,
+        "severity_label": escape(severity.upper()),
+        "title": escape(str(title)),
+        "outcome_suffix": escape(outcome_suffix),
+        "current_volume": format_volume(current_volume),
+        "avg_volume": format_volume(avg_volume),
+        "price_suffix": price_suffix,
+        "spike_ratio": spike_ratio,
+    })
+
+
+def render_volume_spike_alert(spike: dict) -> None:
+    """Render a volume spike alert card."""
+    st.html(_spike_alert_html(spike, bool(st.session_state.get("dark_mode", False))))
+
+
+def render_volume_spike_alerts(spikes: list[dict]) -> None:
+    """Render a list of volume spike alert cards with a single st.html call."""
+    if not spikes:
+        return
+    dark_mode = bool(st.session_state.get("dark_mode", False))
+    st.html("".join(_spike_alert_html(spike, dark_mode) for spike in spikes))
@@ -2,11 +2,23 @@
 Advanced Movers - Extended filtering and analysis view
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import streamlit as st
 
-from packages.core.storage import get_db_pool
-from packages.core.storage.queries import MarketQueries, AnalyticsQueries
-from apps.dashboard.components import render_mover_card, init_watchlist
+from packages.core.storage import DatabasePool
+from packages.core.storage.queries import MOVERS_CACHE_WINDOWS, MarketQueries, AnalyticsQueries
+from apps.dashboard.components import (
+    FONT_LINKS,
+    Mover,
+    flush_toasts,
+    get_dashboard_db_pool,
+    init_watchlist,
+    minify_css,
+    normalize_movers,
+    render_mover_cards_batch,
+)
 
 st.set_page_config(
     page_title="Advanced Movers | PM Movers",
@@ -15,159 +27,120 @@ st.set_page_config(
 )
 
 # Inherit theme from main app
-def get_theme_css():
-    """Get theme CSS based on session state."""
-    dark_mode = st.session_state.get("dark_mode", False)
-    
-    if dark_mode:
-        return """
-        <style>
-            @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=IBM+Plex+Mono:wght@400;500;600&display=swap');
-            
-            :root {
-                --pm-bg: #0c0c10;
-                --pm-surface: #14141a;
-                --pm-surface-2: #1c1c24;
-                --pm-border: #2a2a36;
-                --pm-accent: #6366f1;
-                --pm-green: #10b981;
-                --pm-green-bg: rgba(16, 185, 129, 0.12);
-                --pm-red: #ef4444;
-                --pm-red-bg: rgba(239, 68, 68, 0.12);
-                --pm-text: #f4f4f5;
-                --pm-text-secondary: #a1a1aa;
-                --pm-text-muted: #71717a;
-            }
-            
-            .stApp { background: var(--pm-bg) !important; }
-            section[data-testid="stSidebar"] { background: var(--pm-surface) !important; }
-        </style>
-        """
-    else:
-        return """
-        <style>
-            @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&family=IBM+Plex+Mono:wght@400;500;600&display=swap');
-            
-            :root {
-                --pm-bg: #fafafa;
-                --pm-surface: #ffffff;
-                --pm-surface-2: #f4f4f5;
-                --pm-border: #e4e4e7;
-                --pm-accent: #4f46e5;
-                --pm-green: #059669;
-                --pm-green-bg: rgba(5, 150, 105, 0.08);
-                --pm-red: #dc2626;
-                --pm-red-bg: rgba(220, 38, 38, 0.08);
-                --pm-text: #18181b;
-                --pm-text-secondary: #52525b;
-                --pm-text-muted: #a1a1aa;
-            }
-            
-            .stApp { background: var(--pm-bg) !important; }
-            section[data-testid="stSidebar"] { background: var(--pm-surface) !important; }
-        </style>
-        """
+_DARK_THEME_CSS = """
+    <style>
+        :root {
+            --pm-bg: #0c0c10;
+            --pm-surface: #14141a;
+            --pm-surface-2: #1c1c24;
+            --pm-border: #2a2a36;
+            --pm-accent: #6366f1;
+            --pm-green: #10b981;
+            --pm-green-bg: rgba(16, 185, 129, 0.12);
+            --pm-red: #ef4444;
+            --pm-red-bg: rgba(239, 68, 68, 0.12);
+            --pm-text: #f4f4f5;
+            --pm-text-secondary: #a1a1aa;
+            --pm-text-muted: #71717a;
+        }
+        
+        .stApp { background: var(--pm-bg) !important; }
+        section[data-testid="stSidebar"] { background: var(--pm-surface) !important; }
+    </style>
+    """
 
+_LIGHT_THEME_CSS = """
+    <style>
+        :root {
+            --pm-bg: #fafafa;
+            --pm-surface: #ffffff;
+            --pm-surface-2: #f4f4f5;
+            --pm-border: #e4e4e7;
+            --pm-accent: #4f46e5;
+            --pm-green: #059669;
+            --pm-green-bg: rgba(5, 150, 105, 0.08);
+            --pm-red: #dc2626;
+            --pm-red-bg: rgba(220, 38, 38, 0.08);
+            --pm-text: #18181b;
+            --pm-text-secondary: #52525b;
+            --pm-text-muted: #a1a1aa;
+        }
+        
+        .stApp { background: var(--pm-bg) !important; }
+        section[data-testid="stSidebar"] { background: var(--pm-surface) !important; }
+    </style>
+    """
 
-def _hydrate_market_context(movers: list[dict]) -> list[dict]:
-    """Hydrate mover market fields from markets table, always refreshing canonical URL."""
-    if not movers:
-        return movers
+# Both themes are static, so the page looks its stylesheet up instead of
+# rebuilding it on every rerun.
+_THEME_CSS = {
+    True: FONT_LINKS + minify_css(_DARK_THEME_CSS),
+    False: FONT_LINKS + minify_css(_LIGHT_THEME_CSS),
+}
 
-    missing_ids = {
-        str(m.get("market_id"))
-        for m in movers
-        if m.get("market_id")
-    }
 
-    if not missing_ids:
-        return movers
+def get_theme_css() -> str:
+    """Get theme CSS based on session state."""
+    return _THEME_CSS[bool(st.session_state.get("dark_mode", False))]
 
-    db = get_db_pool()
+
+def _fetch_market_context(db: DatabasePool, market_ids: set[str]) -> dict[str, dict]:
+    """Market rows (title, source, category, url) keyed by market_id."""
+    if not market_ids:
+        return {}
     rows = db.execute(
         """
         SELECT market_id, title, source, source_id, category, url
         FROM markets
         WHERE market_id = ANY(%s::uuid[])
         """,
-        (list(missing_ids),),
+        (list(market_ids),),
         fetch=True,
     ) or []
+    return {str(row["market_id"]): row for row in rows}
 
-    lookup = {str(row["market_id"]): row for row in rows}
-    for mover in movers:
-        market_id = str(mover.get("market_id") or "")
-        if market_id in lookup:
-            record = lookup[market_id]
-            for key in ("title", "source", "source_id", "category"):
-                if not mover.get(key) and record.get(key):
-                    mover[key] = record.get(key)
-            # Always trust canonical URL from markets table over cached mover payload.
-            mover["url"] = record.get("url") or ""
-    return movers
+
+def _apply_market_context(mover: dict, record: dict) -> None:
+    """Fill missing market fields on a mover, always refreshing canonical URL."""
+    for key in ("title", "source", "source_id", "category"):
+        if not mover.get(key) and record.get(key):
+            mover[key] = record.get(key)
+    # Always trust canonical URL from markets table over cached mover payload.
+    mover["url"] = record.get("url") or ""
 
 
-def _summarize_missing_fields(movers: list[dict]) -> dict:
+def _summarize_missing_fields(movers: list[Mover]) -> dict:
     """Count movers missing key fields for diagnostics."""
     missing = {"market_id": 0, "title": 0, "url": 0}
     for mover in movers:
-        if not mover.get("market_id"):
+        if not mover.market_id:
             missing["market_id"] += 1
-        if not mover.get("title"):
+        if not mover.title:
             missing["title"] += 1
-        if not mover.get("url"):
+        if not mover.url:
             missing["url"] += 1
     return missing
 
 
-def _safe_float(value, default: float = 0.0) -> float:
-    """Safely parse values used in numeric filters/labels."""
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return default
-
-
 def _volume_for_display(mover: dict) -> float:
     """Prefer fallback display volume when available."""
-    display_volume = mover.get("display_volume")
-    if display_volume is not None:
-        return _safe_float(display_volume)
-    return _safe_float(
-        mover.get("latest_volume")
-        or mover.get("current_volume")
-        or mover.get("volume_24h")
-        or 0
-    )
-
-
-def _apply_stale_volume_fallback(
-    movers: list[dict],
-    *,
-    enabled: bool,
-) -> list[dict]:
-    """
-    Display-only fallback for movers.
-
-    Keeps freshness gating for ranking/scoring untouched, but optionally surfaces
-    last-known volume in the card UI when fresh volume is unavailable.
-    """
-    if not movers or not enabled:
-        return movers
+    volume = mover.get("display_volume")
+    if volume is None:
+        volume = (
+            mover.get("latest_volume")
+            or mover.get("current_volume")
+            or mover.get("volume_24h")
+        )
+    try:
+        return float(volume or 0)
+    except (TypeError, ValueError):
+        return 0.0
 
-    token_ids: list[str] = []
-    for mover in movers:
-        token_id = mover.get("token_id")
-        if not token_id:
-            continue
-        if _volume_for_display(mover) > 0:
-            continue
-        token_ids.append(str(token_id))
 
+def _fetch_stale_volumes(db: DatabasePool, token_ids: set[str]) -> dict[str, dict]:
+    """Last-known positive volume rows from v_latest_volumes keyed by token_id."""
     if not token_ids:
-        return movers
-
-    db = get_db_pool()
+        return {}
     rows = db.execute(
         """
         SELECT
@@ -182,74 +155,203 @@ def _apply_stale_volume_fallback(
           AND volume_24h IS NOT NULL
           AND volume_24h > 0
         """,
-        (list(set(token_ids)),),
+        (list(token_ids),),
         fetch=True,
     ) or []
+    return {str(row["token_id"]): row for row in rows}
+
 
-    volume_lookup = {str(row["token_id"]): row for row in rows}
+def _apply_stale_volume(mover: dict, row: dict) -> None:
+    """Surface a v_latest_volumes row as the mover's display volume."""
+    # The query only returns numeric, positive volume_24h rows.
+    mover["display_volume"] = float(row["volume_24h"])
+    mover["display_volume_source"] = row.get("volume_source")
+    mover["display_volume_age_seconds"] = float(row.get("volume_age_seconds") or 0)
+    mover["display_volume_is_stale"] = not bool(row.get("is_volume_fresh"))
+
+
+def _index_movers(movers: list[dict]) -> list[dict]:
+    """Store each mover's string market/token ids once as _mid/_tid."""
     for mover in movers:
-        token_id = str(mover.get("token_id") or "")
-        row = volume_lookup.get(token_id)
-        if not row:
-            continue
-        mover["display_volume"] = _safe_float(row.get("volume_24h"))
-        mover["display_volume_source"] = row.get("volume_source")
-        mover["display_volume_age_seconds"] = _safe_float(
-            row.get("volume_age_seconds"),
-            default=0.0,
-        )
-        mover["display_volume_is_stale"] = not bool(row.get("is_volume_fresh"))
+        mover["_mid"] = str(mover.get("market_id") or "")
+        mover["_tid"] = str(mover.get("token_id") or "")
+    return movers
 
+
+def _stale_volume_token_ids(movers: list[dict]) -> set[str]:
+    """Tokens whose movers have no displayable volume (movers must be indexed)."""
+    return {m["_tid"] for m in movers if m["_tid"] and _volume_for_display(m) <= 0}
+
+
+# Hydration and stale-volume lookups are independent round trips to Postgres
+_CONTEXT_FETCHER = ThreadPoolExecutor(max_workers=2, thread_name_prefix="movers-context")
+
+
+def _enrich_movers(movers: list[dict], *, stale_volume_fallback: bool) -> list[dict]:
+    """
+    Add market context and, optionally, stale fallback volume to movers.
+
+    Both lookups are keyed off the same rows, so they run concurrently and
+    are applied in one pass.
+    """
+    if not movers:
+        return movers
+
+    _index_movers(movers)
+    market_ids = {m["_mid"] for m in movers if m["_mid"]}
+    token_ids = _stale_volume_token_ids(movers) if stale_volume_fallback else set()
+
+    # Resolve the cached pool here: workers have no ScriptRunContext for st.cache_resource
+    db = get_dashboard_db_pool()
+    context_future = _CONTEXT_FETCHER.submit(_fetch_market_context, db, market_ids)
+    volumes_future = _CONTEXT_FETCHER.submit(_fetch_stale_volumes, db, token_ids)
+    context, volumes = context_future.result(), volumes_future.result()
+
+    for mover in movers:
+        record = context.get(mover["_mid"])
+        if record:
+            _apply_market_context(mover, record)
+        row = volumes.get(mover["_tid"])
+        if row:
+            _apply_stale_volume(mover, row)
     return movers
 
 
-def main():
-    init_watchlist()
-    
-    # Apply theme
-    st.markdown(get_theme_css(), unsafe_allow_html=True)
-    
-    st.title("📊 Advanced Movers")
-    st.caption("Extended filtering and analysis for power users")
-    
+def _hide_zero_volume(movers: list[Mover]) -> tuple[list[Mover], int]:
+    """
+    Drop movers with no displayed volume.
+
+    Runs after the query because displayed volume may come from the
+    stale-volume fallback. Returns the kept movers and how many were hidden.
+    """
+    kept = [m for m in movers if m.volume > 0]
+    return kept, len(movers) - len(kept)
+
+
+# Windows the collector keeps in movers_cache
+_CACHED_WINDOWS = frozenset(MOVERS_CACHE_WINDOWS)
+
+
+@st.cache_data(ttl=30, max_entries=128, show_spinner=False)
+def _fetch_movers(
+    window_seconds: int,
+    limit: int,
+    category: str | None,
+    direction: str,
+    source: str | None,
+    min_abs_change: float,
+    min_volume: float,
+    stale_volume_fallback: bool,
+) -> list[dict]:
+    """
+    Movers matching the filters, hydrated with market context and, when
+    enabled, stale fallback volume.
+
+    Source and the change/volume floors are applied in SQL so `limit` rows
+    come back already filtered. With the stale-volume fallback on, the volume
+    floor is applied after enrichment instead, so movers without fresh volume
+    are judged on their last-known volume. Cached so reruns with the same
+    filters skip Postgres.
+    """
+    # Standard windows try the cache and fall back to the live query in SQL
+    query = (
+        AnalyticsQueries.get_movers_with_fallback
+        if window_seconds in _CACHED_WINDOWS
+        else MarketQueries.get_movers_window
+    )
+    movers = query(
+        window_seconds=window_seconds,
+        limit=limit,
+        source=source,
+        category=category,
+        direction=direction,
+        min_abs_change=min_abs_change,
+        min_volume=0.0 if stale_volume_fallback else min_volume,
+    )
+
+    # Ensure market context fields are present for rendering/links
+    movers = _enrich_movers(movers, stale_volume_fallback=stale_volume_fallback)
+    if stale_volume_fallback and min_volume > 0:
+        movers = [m for m in movers if _volume_for_display(m) >= min_volume]
+    return movers
+
+
+_PAGE_SIZE = 20
+
+
+@st.fragment
+def _render_mover_pages(movers: list[Mover], watchlist_ids: frozenset) -> None:
+    """
+    Render the first pages of cards with a "Load more" button.
+
+    Only the shown cards get markup and watchlist checkboxes; loading more
+    reruns this fragment rather than re-querying and re-filtering.
+    """
+    shown = st.session_state.get("top_movers_shown", _PAGE_SIZE)
+    render_mover_cards_batch(movers[:shown], show_watchlist=True, watchlist_ids=watchlist_ids)
+
+    remaining = len(movers) - shown
+    if remaining > 0 and st.button(f"Load more ({remaining} remaining)", width="stretch"):
+        st.session_state.top_movers_shown = shown + _PAGE_SIZE
+        st.rerun(scope="fragment")
+
+
+# Filter choices are fixed, so build them once instead of on every rerun
+TIMEFRAME_OPTIONS = {
+    "5 minutes": 5,
+    "15 minutes": 15,
+    "30 minutes": 30,
+    "1 hour": 60,
+    "4 hours": 240,
+    "12 hours": 720,
+    "24 hours": 1440,
+    "7 days": 10080,
+}
+TIMEFRAME_LABELS = tuple(TIMEFRAME_OPTIONS)
+
+CATEGORIES = (
+    "All Categories", "Politics", "Sports", "Crypto", "Finance",
+    "Geopolitics", "Earnings", "Tech", "Culture", "World",
+    "Economy", "Climate & Science", "Elections",
+)
+
+DIRECTION_OPTIONS = {
+    "Both": "both",
+    "Gainers Only": "gainers",
+    "Losers Only": "losers",
+}
+DIRECTION_LABELS = tuple(DIRECTION_OPTIONS)
+
+SOURCE_OPTIONS = ("All Sources", "Polymarket", "Kalshi")
+
+
+@st.fragment
+def _movers_panel():
+    """
+    Filters, stats and the movers grid.
+
+    Runs as a fragment so changing a filter reruns only this panel; the
+    theme CSS and page header above it are left as they are.
+    """
+    watchlist_ids = st.session_state.get("watchlist_ids") or frozenset()
+
     # Advanced filters in columns
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        tf_options = {
-            "5 minutes": 5,
-            "15 minutes": 15,
-            "30 minutes": 30,
-            "1 hour": 60,
-            "4 hours": 240,
-            "12 hours": 720,
-            "24 hours": 1440,
-            "7 days": 10080,
-        }
-        selected_tf = st.selectbox("Timeframe", options=list(tf_options.keys()), index=3)
-        window_minutes = tf_options[selected_tf]
+        selected_tf = st.selectbox("Timeframe", options=TIMEFRAME_LABELS, index=3)
+        window_minutes = TIMEFRAME_OPTIONS[selected_tf]
     
     with col2:
-        CATEGORIES = [
-            "All Categories", "Politics", "Sports", "Crypto", "Finance", 
-            "Geopolitics", "Earnings", "Tech", "Culture", "World", 
-            "Economy", "Climate & Science", "Elections"
-        ]
         selected_category = st.selectbox("Category", options=CATEGORIES)
         category_filter = None if selected_category == "All Categories" else selected_category
     
     with col3:
-        direction_options = {
-            "Both": "both",
-            "Gainers Only": "up",
-            "Losers Only": "down",
-        }
-        selected_direction = st.selectbox("Direction", options=list(direction_options.keys()))
-        direction = direction_options[selected_direction]
+        selected_direction = st.selectbox("Direction", options=DIRECTION_LABELS)
+        direction = DIRECTION_OPTIONS[selected_direction]
     
     with col4:
-        source_options = ["All Sources", "Polymarket", "Kalshi"]
-        selected_source = st.selectbox("Source", options=source_options)
+        selected_source = st.selectbox("Source", options=SOURCE_OPTIONS)
         source_filter = None if selected_source == "All Sources" else selected_source.lower()
     
     # Additional filters
@@ -283,7 +385,7 @@ def main():
     
     # Fetch and display movers
     try:
-        db = get_db_pool()
+        db = get_dashboard_db_pool()
         db_healthy = db.health_check()
         with st.expander("Connection status", expanded=False):
             if db_healthy:
@@ -296,59 +398,33 @@ def main():
             st.error("Unable to load movers until the database is healthy.")
             return
 
-        window_seconds = window_minutes * 60
-        movers = []
-        
-        # Try cached first for standard windows
-        cached_windows = [300, 3600, 86400]
-        if window_seconds in cached_windows:
-            movers = AnalyticsQueries.get_cached_movers(
-                window_seconds=window_seconds,
-                limit=limit,
-                category=category_filter,
-                direction=direction
-            )
-        
-        if not movers:
-            movers = MarketQueries.get_movers_window(
-                window_seconds=window_seconds,
-                limit=limit,
-                category=category_filter,
-                direction=direction
-            )
-        
-        # Ensure market context fields are present for rendering/links
-        movers = _hydrate_market_context(movers)
-        movers = _apply_stale_volume_fallback(
-            movers,
-            enabled=show_stale_volume_fallback,
+        movers = _fetch_movers(
+            window_minutes * 60,
+            limit,
+            category_filter,
+            direction,
+            source_filter,
+            float(min_change),
+            float(min_volume),
+            show_stale_volume_fallback,
         )
-
-        # Apply additional filters
-        if source_filter:
-            movers = [m for m in movers if m.get('source', '').lower() == source_filter]
-        
-        if min_change > 0:
-            movers = [m for m in movers if abs(float(m.get('pct_change') or m.get('move_pp') or 0)) >= min_change]
-        
-        if min_volume > 0:
-            movers = [m for m in movers if _volume_for_display(m) >= min_volume]
+        # Resolve column fallbacks once; filters and cards read plain attributes.
+        movers = normalize_movers(movers)
 
         hidden_zero_count = 0
         if hide_zero_volume:
-            before_count = len(movers)
-            movers = [m for m in movers if _volume_for_display(m) > 0]
-            hidden_zero_count = before_count - len(movers)
+            movers, hidden_zero_count = _hide_zero_volume(movers)
         
         # Stats summary
         if movers:
-            gainers = [m for m in movers if float(m.get('pct_change') or m.get('move_pp') or 0) > 0]
-            losers = [m for m in movers if float(m.get('pct_change') or m.get('move_pp') or 0) < 0]
+            pct_changes = np.fromiter((m.pct_change for m in movers), dtype=float, count=len(movers))
+            gainers = int((pct_changes > 0).sum())
+            losers = int((pct_changes < 0).sum())
             
             col_s1, col_s2, col_s3 = st.columns(3)
             col_s1.metric("Total Results", len(movers))
-            col_s2.metric("Gainers", len(gainers), delta=None)
-            col_s3.metric("Losers", len(losers), delta=None)
+            col_s2.metric("Gainers", gainers, delta=None)
+            col_s3.metric("Losers", losers, delta=None)
             
             st.markdown("---")
         
@@ -361,7 +437,7 @@ def main():
             st.warning("Some movers are missing market metadata. Data may be incomplete.")
         if missing_fields["url"]:
             st.caption(f"Links available for {len(movers) - missing_fields['url']} of {len(movers)} movers.")
-        stale_volume_count = sum(1 for mover in movers if mover.get("display_volume_is_stale"))
+        stale_volume_count = sum(1 for mover in movers if mover.stale_volume)
         if show_stale_volume_fallback and stale_volume_count:
             st.caption(
                 f"Showing stale fallback volume for {stale_volume_count} movers "
@@ -370,13 +446,39 @@ def main():
         if hidden_zero_count:
             st.caption(f"Hidden {hidden_zero_count} zero-volume movers.")
         
-        # Display as cards
-        for mover in movers:
-            render_mover_card(mover, show_watchlist=True)
+        # Display as cards; only a filter change sends paging back to the first page
+        filters = (
+            window_minutes,
+            category_filter,
+            direction,
+            source_filter,
+            min_change,
+            min_volume,
+            limit,
+            show_stale_volume_fallback,
+            hide_zero_volume,
+        )
+        if st.session_state.get("top_movers_filters") != filters:
+            st.session_state.top_movers_filters = filters
+            st.session_state.top_movers_shown = _PAGE_SIZE
+        _render_mover_pages(movers, watchlist_ids)
             
     except Exception as e:
         st.error(f"Error loading data: {e}")
 
 
+def main():
+    init_watchlist()
+    flush_toasts()
+    
+    # Apply theme
+    st.markdown(get_theme_css(), unsafe_allow_html=True)
+    
+    st.title("📊 Advanced Movers")
+    st.caption("Extended filtering and analysis for power users")
+
+    _movers_panel()
+
+
 if __name__ == "__main__":
     main()
@@ -5,6 +5,7 @@ Category Trends - Aggregated views of market movements.
 import streamlit as st
 import pandas as pd
 import altair as alt
+from apps.dashboard.components import Mover, flush_toasts, normalize_movers, render_mover_cards_batch
 from packages.core.storage.queries import MarketQueries
 
 st.set_page_config(
@@ -25,7 +26,27 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_category_movers(hours: int, category: str) -> list[Mover]:
+    """Top movers for one category, normalized for card rendering (cached for 60s)."""
+    return normalize_movers(
+        MarketQueries.get_top_movers(
+            hours=hours,
+            limit=10,
+            category=category,
+            direction="both",
+        )
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_category_stats(hours: int) -> list[dict]:
+    """Per-category volatility and volume stats (cached for 60s)."""
+    return MarketQueries.get_category_stats(hours=hours)
+
+
 def main():
+    flush_toasts()
     st.title("📊 Category Trends")
     st.markdown("Analyze market volatility and volume across different categories.")
     
@@ -41,7 +62,7 @@ def main():
     
     # Fetch Data
     with st.spinner("Crunching numbers..."):
-        stats = MarketQueries.get_category_stats(hours=timeframe)
+        stats = get_category_stats(timeframe)
         
     if not stats:
         st.info("No category data available yet. Wait for more data collection.")
@@ -49,9 +70,9 @@ def main():
         
     df = pd.DataFrame(stats)
     
-    # Process numeric columns
-    df["avg_abs_move"] = pd.to_numeric(df["avg_abs_move"])
-    df["total_volume"] = pd.to_numeric(df["total_volume"])
+    # Process numeric columns (Decimal from Postgres) in one pass
+    numeric_cols = ["avg_abs_move", "total_volume"]
+    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric)
     
     # 1. Bar Chart: Volatility (Avg Abs Move)
     st.subheader("🔥 Volatility by Category")
@@ -87,23 +108,13 @@ def main():
     )
     
     if selected_category:
-        from apps.dashboard.components import render_mover_card
-        
         # Now we filter by category in the SQL query
-        movers = MarketQueries.get_top_movers(
-            hours=timeframe,
-            limit=10,
-            category=selected_category,
-            direction="both"
-        )
+        movers = get_category_movers(timeframe, selected_category)
         
         if not movers:
             st.warning(f"No significant movers found in {selected_category} for this timeframe.")
         else:
-            col_left, col_right = st.columns(2)
-            for i, mover in enumerate(movers):
-                with col_left if i % 2 == 0 else col_right:
-                    render_mover_card(mover)
+            render_mover_cards_batch(movers)
 
 if __name__ == "__main__":
     main()
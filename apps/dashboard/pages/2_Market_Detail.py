@@ -3,17 +3,20 @@ Market Detail Page - Deep dive into individual markets.
 Supports both Polymarket and Kalshi with source-specific displays.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from html import escape
+import math
 from textwrap import dedent
+import time
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from packages.core.storage import get_db_pool
 from packages.core.storage.queries import MarketQueries, OHLCQueries
-from apps.dashboard.components import normalize_market_url, to_user_tz
+from apps.dashboard.components import FONT_LINKS, get_dashboard_db_pool, lttb_indices, minify_css, normalize_market_url, to_user_tz_series
 
 st.set_page_config(
     page_title="Market Detail | PM Movers",
@@ -22,10 +25,8 @@ st.set_page_config(
 )
 
 # Custom styling
-st.markdown("""
+st.markdown(FONT_LINKS + minify_css("""
 <style>
-    @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600&family=Space+Grotesk:wght@400;500;700&display=swap');
-    
     .page-title {
         font-family: 'Space Grotesk', sans-serif;
         font-size: 2rem;
@@ -122,7 +123,7 @@ st.markdown("""
     .bid { color: #00d4aa; }
     .ask { color: #ff4757; }
 </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 
 def get_source_badge(source: str) -> str:
@@ -161,6 +162,11 @@ def build_market_header_html(
     ).strip()
 
 
+# Line and area-fill colors per outcome (YES green, anything else red)
+_LINE_COLOR = {True: "#00d4aa", False: "#ff4757"}
+_FILL_COLOR = {True: "rgba(0,212,170,0.1)", False: "rgba(255,71,87,0.1)"}
+
+
 def create_price_chart(data: list[dict], token_outcome: str, use_ohlc: bool = False, show_spread: bool = False) -> go.Figure:
     """
     Create a price chart for a token.
@@ -171,11 +177,12 @@ def create_price_chart(data: list[dict], token_outcome: str, use_ohlc: bool = Fa
         return None
 
     df = pd.DataFrame(data)
-    df["ts"] = pd.to_datetime(df["ts"])
-    df["ts"] = df["ts"].apply(to_user_tz)
+    df["ts"] = to_user_tz_series(df["ts"])
     df = df.sort_values("ts")
 
-    color = "#00d4aa" if token_outcome == "YES" else "#ff4757"
+    is_yes = token_outcome == "YES"
+    color = _LINE_COLOR[is_yes]
+    fill_color = _FILL_COLOR[is_yes]
 
     fig = go.Figure()
 
@@ -198,7 +205,7 @@ def create_price_chart(data: list[dict], token_outcome: str, use_ohlc: bool = Fa
             name="Low",
             line=dict(color=color, width=1, dash="dot"),
             fill="tonexty",
-            fillcolor=f"rgba({','.join(str(int(color[i:i+2], 16)) for i in (1, 3, 5))}, 0.1)",
+            fillcolor=fill_color,
             opacity=0.3,
             showlegend=False,
         ))
@@ -219,7 +226,7 @@ def create_price_chart(data: list[dict], token_outcome: str, use_ohlc: bool = Fa
             name=f"{token_outcome} Price",
             line=dict(color=color, width=2),
             fill="tozeroy",
-            fillcolor=f"rgba({','.join(str(int(color[i:i+2], 16)) for i in (1, 3, 5))}, 0.1)",
+            fillcolor=fill_color,
         ))
         
         # Add spread visualization if available
@@ -276,9 +283,121 @@ def create_price_chart(data: list[dict], token_outcome: str, use_ohlc: bool = Fa
     return fig
 
 
+# Snapshot history is thinned to this many points per token before charting
+_CHART_MAX_POINTS = 400
+
+
+def _downsample_snapshots(rows: list[dict]) -> list[dict]:
+    """Keep the LTTB-selected subset of a token's snapshot rows."""
+    if len(rows) <= _CHART_MAX_POINTS:
+        return rows
+    ts = np.fromiter((row["ts"].timestamp() for row in rows), dtype=float, count=len(rows))
+    price = np.fromiter(
+        (float(row["price"]) if row["price"] is not None else np.nan for row in rows),
+        dtype=float,
+        count=len(rows),
+    )
+    return [rows[i] for i in lttb_indices(ts, np.nan_to_num(price), _CHART_MAX_POINTS)]
+
+
+# Candles are fetched per token; independent round trips run concurrently so a
+# multi-outcome market waits on its slowest token, not the sum of all of them
+_CANDLE_FETCHER = ThreadPoolExecutor(max_workers=4, thread_name_prefix="market-candles")
+
+
+@st.cache_data(ttl=60, max_entries=1024, show_spinner=False)
+def load_price_history(
+    token_ids: tuple[str, ...], hours: int, minute_bucket: int
+) -> dict[str, list[dict]]:
+    """
+    Chart rows per token over the last `hours`, keyed by token_id.
+
+    `minute_bucket` (epoch minutes) pins the window start so reruns within
+    the same minute share a cache entry instead of re-querying. Snapshots
+    for every token come back from a single query, averaged in SQL into
+    buckets sized for about twice the charted points, then LTTB picks the
+    points to chart, so the cached entry holds only charted points.
+    """
+    start_ts = (
+        datetime.fromtimestamp(minute_bucket * 60, tz=timezone.utc).replace(tzinfo=None)
+        - timedelta(hours=hours)
+    )
+    if hours >= 6:
+        candles = _CANDLE_FETCHER.map(
+            lambda token_id: OHLCQueries.get_candles_for_timeframe(
+                token_id=token_id,
+                start_ts=start_ts,
+                hours=hours,
+            ),
+            token_ids,
+        )
+        return dict(zip(token_ids, candles))
+    bucket_seconds = max(1, math.ceil(hours * 3600 / (2 * _CHART_MAX_POINTS)))
+    histories = MarketQueries.get_snapshots_downsampled_bulk(list(token_ids), start_ts, bucket_seconds)
+    return {token_id: _downsample_snapshots(rows) for token_id, rows in histories.items()}
+
+
+# Selector entries per search; the title index (migration 026) keeps
+# substring matches cheap, and a search narrows rather than pages the list.
+MARKET_OPTIONS_LIMIT = 50
+
+
+@st.cache_data(ttl=300, max_entries=512, show_spinner=False)
+def load_market_options(source: str | None, query: str = "", limit: int = MARKET_OPTIONS_LIMIT) -> dict[str, str]:
+    """
+    Selector labels mapped to market_id for the most recently updated active
+    markets, optionally narrowed to titles containing `query`.
+
+    Callers pass the query stripped and lowercased so repeat searches share a
+    cache entry; the label dict is built once per entry, not per rerun.
+    """
+    conditions = ["status = 'active'"]
+    params: list[object] = []
+    if source:
+        conditions.append("source = %s")
+        params.append(source)
+    if query:
+        conditions.append("title ILIKE %s")
+        params.append(f"%{query}%")
+    params.append(limit)
+    rows = get_dashboard_db_pool().execute(f"""
+        SELECT market_id, title, source
+        FROM markets
+        WHERE {" AND ".join(conditions)}
+        ORDER BY updated_at DESC
+        LIMIT %s
+    """, tuple(params), fetch=True) or []
+
+    options = {}
+    for m in rows:
+        source_tag = "🟣" if m['source'] == 'polymarket' else "🔵"
+        title = m['title'][:55] + "..." if len(m['title']) > 55 else m['title']
+        options[f"{source_tag} {title}"] = str(m['market_id'])
+    return options
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_active_market_counts() -> dict[str, int]:
+    """Active market count per source (cached for 60s)."""
+    rows = get_dashboard_db_pool().execute("""
+        SELECT source, COUNT(*) as cnt
+        FROM markets
+        WHERE status = 'active'
+        GROUP BY source
+    """, fetch=True) or []
+    return {row["source"]: row["cnt"] for row in rows}
+
+
+@st.cache_data(ttl=30, max_entries=256, show_spinner=False)
+def load_market(market_id: str) -> dict | None:
+    """Market with its tokens and latest prices (cached for 30s)."""
+    return MarketQueries.get_market_with_tokens_and_latest_prices(market_id)
+
+
+@st.cache_data(ttl=30, max_entries=256, show_spinner=False)
 def get_kalshi_specific_data(market_id: str) -> dict:
-    """Fetch Kalshi-specific data like spread and open interest."""
-    db = get_db_pool()
+    """Fetch Kalshi-specific data like spread and open interest (cached for 30s)."""
+    db = get_dashboard_db_pool()
     try:
         # Get latest snapshot with spread
         result = db.execute("""
@@ -307,8 +426,6 @@ def get_kalshi_specific_data(market_id: str) -> dict:
 def main():
     st.markdown('<h1 class="page-title">🔍 Market Detail</h1>', unsafe_allow_html=True)
     
-    db = get_db_pool()
-    
     # Source filter
     col1, col2 = st.columns([1, 3])
     with col1:
@@ -318,29 +435,25 @@ def main():
             index=0,
         )
     
-    # Build query based on filter
-    source_condition = ""
-    params = []
-    if source_filter == "Polymarket":
-        source_condition = "AND source = 'polymarket'"
-    elif source_filter == "Kalshi":
-        source_condition = "AND source = 'kalshi'"
-    
-    # Fetch available markets
+    search = st.text_input(
+        "Search markets",
+        placeholder=f"Type to search; showing the {MARKET_OPTIONS_LIMIT} most recently updated",
+    ).strip().lower()
+
+    # Fetch matching markets
     try:
-        markets = db.execute(f"""
-            SELECT market_id, title, source, category 
-            FROM markets 
-            WHERE status = 'active' {source_condition}
-            ORDER BY updated_at DESC
-            LIMIT 200
-        """, fetch=True)
+        market_options = load_market_options(
+            None if source_filter == "All" else source_filter.lower(),
+            search,
+        )
     except Exception as e:
         st.error(f"Error fetching markets: {e}")
-        markets = []
+        market_options = {}
     
-    if not markets:
-        if source_filter != "All":
+    if not market_options:
+        if search:
+            st.info(f"No active markets match “{search}”.")
+        elif source_filter != "All":
             st.info(f"""
             📭 **No {source_filter} markets available yet.**
             
@@ -357,33 +470,22 @@ def main():
     
     # Show market counts by source (always show total counts, not filtered)
     try:
-        all_markets_count = db.execute("""
-            SELECT source, COUNT(*) as cnt 
-            FROM markets 
-            WHERE status = 'active' 
-            GROUP BY source
-        """, fetch=True)
-        poly_total = sum(m['cnt'] for m in all_markets_count if m['source'] == 'polymarket')
-        kalshi_total = sum(m['cnt'] for m in all_markets_count if m['source'] == 'kalshi')
+        market_counts = load_active_market_counts()
     except Exception:
-        poly_total = sum(1 for m in markets if m['source'] == 'polymarket')
-        kalshi_total = sum(1 for m in markets if m['source'] == 'kalshi')
-    
-    with col2:
-        filter_note = f" (showing {source_filter})" if source_filter != "All" else ""
-        st.caption(f"📊 {poly_total} Polymarket | {kalshi_total} Kalshi total{filter_note}")
+        market_counts = {}
+    
+    if market_counts:
+        with col2:
+            filter_note = f" (showing {source_filter})" if source_filter != "All" else ""
+            st.caption(
+                f"📊 {market_counts.get('polymarket', 0)} Polymarket | "
+                f"{market_counts.get('kalshi', 0)} Kalshi total{filter_note}"
+            )
     
     # Market selector with source indicator
-    market_options = {}
-    for m in markets:
-        source_tag = "🟣" if m['source'] == 'polymarket' else "🔵"
-        title = m['title'][:55] + "..." if len(m['title']) > 55 else m['title']
-        label = f"{source_tag} {title}"
-        market_options[label] = m['market_id']
-    
     selected_label = st.selectbox(
         "Select a Market",
-        options=list(market_options.keys()),
+        options=tuple(market_options),
     )
     
     if not selected_label:
@@ -392,7 +494,7 @@ def main():
     market_id = market_options[selected_label]
     
     # Fetch market details
-    market = MarketQueries.get_market_with_tokens_and_latest_prices(market_id)
+    market = load_market(market_id)
     
     if not market:
         st.error("Market not found")
@@ -532,7 +634,7 @@ def main():
         "30D": 720,
     }
     hours = timeframe_hours.get(timeframe, 24)
-    start_ts = datetime.utcnow() - timedelta(hours=hours)
+    minute_bucket = int(time.time() // 60)
     
     # Fetch and display charts for each token
     if tokens and tokens[0]:
@@ -544,6 +646,12 @@ def main():
         else:
             st.caption("📊 Using raw price snapshots")
 
+        history = load_price_history(
+            tuple(str(token["token_id"]) for token in tokens if token and token.get("token_id")),
+            hours,
+            minute_bucket,
+        )
+
         for token in tokens:
             if token and token.get("token_id"):
                 outcome = token.get('outcome', 'Unknown')
@@ -552,17 +660,7 @@ def main():
 
                 use_ohlc = hours >= 6
 
-                if use_ohlc:
-                    data = OHLCQueries.get_candles_for_timeframe(
-                        token_id=token["token_id"],
-                        start_ts=start_ts,
-                        hours=hours,
-                    )
-                else:
-                    data = MarketQueries.get_snapshots_range(
-                        token_id=token["token_id"],
-                        start_ts=start_ts,
-                    )
+                data = history.get(str(token["token_id"]))
 
                 if data:
                     fig = create_price_chart(
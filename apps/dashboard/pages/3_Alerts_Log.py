@@ -14,6 +14,10 @@ st.markdown("History of significant market movements.")
 
 SEVERITY_ORDER = {"none": 0, "notable": 1, "significant": 2, "extreme": 3}
 
+# Alerts only change when the collector writes new ones; filter tweaks within
+# this window reuse the fetched rows instead of re-querying.
+ALERTS_CACHE_TTL_SECONDS = 30
+
 
 def compute_hours_to_expiry(alert: dict) -> float | None:
     raw_hours = alert.get("hours_to_expiry")
@@ -73,6 +77,7 @@ def render_filters():
     }
 
 
+@st.cache_data(ttl=ALERTS_CACHE_TTL_SECONDS, show_spinner=False)
 def get_alerts_data(limit: int, unack_only: bool, source: str) -> list[dict]:
     source_filter = source.lower() if source != "All" else None
     if source_filter:
@@ -3,10 +3,18 @@ Watchlist Page - View and manage your watched markets.
 """
 
 import streamlit as st
-import pandas as pd
-from datetime import datetime
-
-from apps.dashboard.components import get_watchlist, toggle_watchlist, init_watchlist, to_user_tz
+from datetime import datetime, timezone
+
+from apps.dashboard.components import (
+    FONT_LINKS,
+    enqueue_toast,
+    flush_toasts,
+    get_watchlist,
+    init_watchlist,
+    minify_css,
+    to_user_tz,
+    toggle_watchlist,
+)
 from packages.core.storage.queries import MarketQueries
 
 st.set_page_config(
@@ -16,10 +24,8 @@ st.set_page_config(
 )
 
 # Custom styling
-st.markdown("""
+st.markdown(FONT_LINKS + minify_css("""
 <style>
-    @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600&family=Space+Grotesk:wght@400;500;700&display=swap');
-
     .page-title {
         font-family: 'Space Grotesk', sans-serif;
         font-size: 2rem;
@@ -74,7 +80,16 @@ st.markdown("""
         color: #71717a;
     }
 </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
+
+
+def _added_at_label(added_at) -> str:
+    """Format a watchlist added_at (DB datetime or session epoch-ns int) for display."""
+    if not added_at:
+        return ""
+    if isinstance(added_at, int):
+        added_at = datetime.fromtimestamp(added_at / 1e9, tz=timezone.utc)
+    return to_user_tz(added_at).strftime('%Y-%m-%d %H:%M')
 
 
 def main():
@@ -83,6 +98,7 @@ def main():
 
     # Initialize watchlist
     init_watchlist()
+    flush_toasts()
     watchlist = get_watchlist()
 
     if not watchlist:
@@ -101,6 +117,7 @@ def main():
     # Clear all button
     if st.button("🗑️ Clear Watchlist", type="secondary"):
         st.session_state.watchlist = {}
+        st.session_state.watchlist_ids = frozenset()
         st.rerun()
 
     # Display each watched market with current prices
@@ -127,7 +144,8 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
                 if st.button("Remove", key=f"remove_{market_id}"):
-                    toggle_watchlist(market_id, "", "")
+                    if toggle_watchlist(market_id, "", "") is not None:
+                        enqueue_toast("Removed from watchlist")
                     st.rerun()
                 continue
 
@@ -148,7 +166,7 @@ def main():
                     <div>
                         <span class="source-tag">{market.get('source', 'unknown')}</span>
                         <span style="color: #71717a; font-size: 0.75rem; margin-left: 0.5rem;">
-                            Added {to_user_tz(datetime.fromisoformat(info.get('added_at', ''))).strftime('%Y-%m-%d %H:%M') if info.get('added_at') else ''}
+                            Added {_added_at_label(info.get('added_at'))}
                         </span>
                     </div>
                     <span style="color: #fbbf24; font-size: 1.25rem;">★</span>
@@ -171,7 +189,8 @@ def main():
                     st.switch_page("pages/2_Market_Detail.py")
             with btn_col2:
                 if st.button("✕ Remove", key=f"remove_{market_id}", width="stretch"):
-                    toggle_watchlist(market_id, "", "")
+                    if toggle_watchlist(market_id, "", "") is not None:
+                        enqueue_toast("Removed from watchlist")
                     st.rerun()
 
 
@@ -3,12 +3,11 @@ Custom Alerts Page - Create and manage personalized price alerts.
 """
 
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 import uuid
 
 from packages.core.storage.queries import MarketQueries, UserAlertsQueries
-from packages.core.storage import get_db_pool
+from apps.dashboard.components import FONT_LINKS, get_dashboard_db_pool, minify_css
 
 st.set_page_config(
     page_title="Custom Alerts | PM Movers",
@@ -23,10 +22,8 @@ if 'user_session_id' not in st.session_state:
 SESSION_ID = st.session_state.user_session_id
 
 # Custom styling
-st.markdown("""
+st.markdown(FONT_LINKS + minify_css("""
 <style>
-    @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600&family=Space+Grotesk:wght@400;500;700&display=swap');
-
     .page-title {
         font-family: 'Space Grotesk', sans-serif;
         font-size: 2rem;
@@ -82,7 +79,7 @@ st.markdown("""
         color: #5865f2;
     }
 </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 
 def get_session_id():
@@ -112,7 +109,7 @@ def create_alert_form():
     st.subheader("Create New Alert")
 
     # Fetch available markets
-    db = get_db_pool()
+    db = get_dashboard_db_pool()
     try:
         markets = db.execute("""
             SELECT m.market_id, m.title, m.source,
@@ -2,6 +2,7 @@
 Live View - real-time snapshot tape and short-window movers.
 """
 
+import time
 from datetime import datetime, timezone
 
 import pandas as pd
@@ -17,15 +18,16 @@ except ImportError:
         return None
 
 from apps.dashboard.components import (
+    get_dashboard_db_pool,
     get_watchlist,
     init_watchlist,
-    render_mover_card,
-    render_volume_spike_alert,
+    render_mover_cards_batch,
+    render_volume_spike_alerts,
     to_user_tz,
+    to_user_tz_series,
 )
 from packages.core.analytics import metrics as analytics_metrics
-from packages.core.storage import get_db_pool
-from packages.core.storage.queries import AnalyticsQueries, MarketQueries, VolumeQueries
+from packages.core.storage.queries import MOVERS_CACHE_WINDOWS, AnalyticsQueries, MarketQueries, VolumeQueries
 from packages.core.wss import WSSMetrics
 
 
@@ -36,10 +38,17 @@ st.set_page_config(
 )
 
 
+def _epoch_seconds(ts: datetime) -> float:
+    """Convert a DB timestamp to epoch seconds, treating naive values as UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
 def get_live_status() -> dict:
     """Summarize live status based on WSS metrics + recent DB activity."""
     metrics = WSSMetrics.load_with_activity_check()
-    db = get_db_pool()
+    db = get_dashboard_db_pool()
 
     last_snapshot_ts = None
     try:
@@ -64,9 +73,7 @@ def get_live_status() -> dict:
 
     last_snapshot_age = None
     if last_snapshot_ts:
-        if last_snapshot_ts.tzinfo is None:
-            last_snapshot_ts = last_snapshot_ts.replace(tzinfo=timezone.utc)
-        last_snapshot_age = (datetime.now(timezone.utc) - last_snapshot_ts).total_seconds()
+        last_snapshot_age = time.time() - _epoch_seconds(last_snapshot_ts)
 
     return {
         "status": status,
@@ -82,7 +89,7 @@ def get_live_status() -> dict:
 def check_database_connection() -> tuple[bool, str]:
     """Check if database is accessible."""
     try:
-        db = get_db_pool()
+        db = get_dashboard_db_pool()
         if db.health_check():
             stats = db.get_pool_stats()
             return True, f"pool {stats.get('size', 0)}/{stats.get('max_size', 0)}"
@@ -93,7 +100,7 @@ def check_database_connection() -> tuple[bool, str]:
 
 def get_system_status_entries() -> dict:
     """Fetch system_status rows as a keyed dict."""
-    db = get_db_pool()
+    db = get_dashboard_db_pool()
     rows = db.execute("SELECT key, value, updated_at FROM system_status", fetch=True) or []
     entries: dict[str, dict] = {}
     for row in rows:
@@ -118,19 +125,16 @@ def _normalize_source_filter(source: str | None) -> str | None:
 
 
 def _cached_window_for_live_movers(window_seconds: int) -> int:
-    """Map requested live window to available movers-cache windows."""
-    if window_seconds <= 300:
-        return 300
-    if window_seconds <= 900:
-        return 900
-    if window_seconds <= 3600:
-        return 3600
-    return 86400
+    """Map requested live window to the smallest movers-cache window covering it."""
+    return next(
+        (window for window in MOVERS_CACHE_WINDOWS if window_seconds <= window),
+        MOVERS_CACHE_WINDOWS[-1],
+    )
 
 
 def get_live_tape(seconds: int, limit: int, source: str | None = None) -> list[dict]:
     """Fetch latest per-token snapshots within the time window."""
-    db = get_db_pool()
+    db = get_dashboard_db_pool()
     sample_limit = max(limit * 12, 240)
     source_filter = _normalize_source_filter(source)
     source_clause = "AND m.source = %s" if source_filter else ""
@@ -362,6 +366,7 @@ def render_system_health_panel():
             col3.metric("Last WSS Message", "—")
 
         service_cols = st.columns(2)
+        now = time.time()
         for idx, key in enumerate(["polymarket_wss", "kalshi_wss"]):
             service = status_entries.get(key)
             with service_cols[idx]:
@@ -372,9 +377,7 @@ def render_system_health_panel():
                 last_updated = service.get("db_updated_at")
                 last_age = None
                 if last_updated:
-                    if last_updated.tzinfo is None:
-                        last_updated = last_updated.replace(tzinfo=timezone.utc)
-                    last_age = (datetime.now(timezone.utc) - last_updated).total_seconds()
+                    last_age = now - _epoch_seconds(last_updated)
                 badge, state_label = get_service_badge(service, last_age)
                 subs_count = service.get("subscription_count")
                 subs_target = service.get("subscription_target")
@@ -424,8 +427,7 @@ def render_live_movers(window_seconds: int, limit: int, source: str | None = Non
             st.caption(f"Using live {source.title()} movers fallback (cache empty).")
         else:
             st.caption("Using live movers fallback (cache empty).")
-    for mover in movers:
-        render_mover_card(mover, show_watchlist=False)
+    render_mover_cards_batch(movers, show_watchlist=False)
 
 
 def render_live_tape(seconds: int, limit: int, source: str | None = None):
@@ -438,7 +440,7 @@ def render_live_tape(seconds: int, limit: int, source: str | None = None):
         return
 
     df = pd.DataFrame(rows)
-    df["ts"] = df["ts"].apply(to_user_tz)
+    df["ts"] = to_user_tz_series(df["ts"])
     df["price"] = df["price"].astype(float)
     df["volume_24h"] = pd.to_numeric(df["volume_24h"], errors="coerce").fillna(0.0)
     df["source"] = df["source"].str.upper()
@@ -553,8 +555,7 @@ def render_volume_spikes(min_severity: str, limit: int, unack_only: bool):
     if not spikes:
         st.info("No recent volume spikes.")
         return
-    for spike in spikes:
-        render_volume_spike_alert(spike)
+    render_volume_spike_alerts(spikes)
 
 
 def render_watchlist_tiles(delta_minutes: int, limit: int):
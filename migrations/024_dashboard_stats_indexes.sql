@@ -0,0 +1,14 @@
+-- Index support for dashboard quick-stats queries
+-- - Partial index so COUNT(*) over active markets can use an index-only scan
+-- - Latest-snapshot lookups (ORDER BY ts DESC LIMIT 1) are already served by
+--   idx_snapshots_ts_btree from 004; no extra snapshots index is needed.
+--
+-- Migrations run inside a transaction, so CONCURRENTLY is not available here.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_markets_active_id
+    ON markets(market_id)
+    WHERE status = 'active';
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- Index support for the filtered movers queries
+-- - get_movers_window / get_cached_movers scope markets by status = 'active'
+--   plus optional source and category; a partial composite index serves any
+--   prefix of (source, category) without touching inactive markets.
+-- - movers_cache lookups (latest batch for a window, ORDER BY rank) are
+--   already served by the primary key and idx_movers_cache_window_ts from
+--   002, and each batch is capped at 500 rows, so no extra cache index or
+--   BRIN index is added there.
+--
+-- Migrations run inside a transaction, so CONCURRENTLY is not available here.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_markets_active_source_category
+    ON markets(source, category)
+    WHERE status = 'active';
+
+COMMIT;
@@ -0,0 +1,17 @@
+-- Trigram index for market title search
+-- - The Market Detail selector filters active markets with
+--   title ILIKE '%term%'; a leading wildcard can't use a btree, but a pg_trgm
+--   GIN index serves it.
+-- - Partial on status = 'active' to match the selector's filter.
+--
+-- Migrations run inside a transaction, so CONCURRENTLY is not available here.
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_markets_active_title_trgm
+    ON markets USING gin (title gin_trgm_ops)
+    WHERE status = 'active';
+
+COMMIT;
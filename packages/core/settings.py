@@ -29,6 +29,11 @@ class Settings(BaseSettings):
     db_pool_min_size: int = Field(default=2, ge=1, le=10)
     db_pool_max_size: int = Field(default=10, ge=2, le=50)
     db_connection_timeout: float = Field(default=30.0, ge=5.0)
+    db_prepared_max: int = Field(
+        default=256,
+        ge=0,
+        description="Per-connection cap on psycopg's prepared statement cache",
+    )
     
     # API Keys
     polymarket_api_key: Optional[str] = Field(default=None)
@@ -228,6 +233,12 @@ class Settings(BaseSettings):
     
     # Streamlit Settings
     streamlit_server_port: int = Field(default=8501)
+    dashboard_health_check_interval_seconds: float = Field(
+        default=5.0,
+        ge=1.0,
+        le=300.0,
+        description="How long the dashboard caches its database health check",
+    )
     
     @field_validator("log_level")
     @classmethod
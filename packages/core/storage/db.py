@@ -5,10 +5,10 @@ Provides both sync (psycopg) and async (asyncpg) interfaces.
 
 import logging
 from contextlib import asynccontextmanager, contextmanager
-from typing import AsyncGenerator, Generator, Optional
+from typing import Any, AsyncGenerator, Generator, Optional
 
 import psycopg
-from psycopg.rows import dict_row
+from psycopg.rows import dict_row, tuple_row
 from psycopg_pool import ConnectionPool
 
 from packages.core.settings import settings
@@ -70,12 +70,18 @@ class DatabasePool:
             timeout=settings.db_connection_timeout,
             open=True,
             kwargs={"row_factory": dict_row},
+            configure=self._configure_connection,
         )
         logger.info(
             f"Database pool initialized (min={settings.db_pool_min_size}, "
             f"max={settings.db_pool_max_size})"
         )
     
+    @staticmethod
+    def _configure_connection(conn: psycopg.Connection) -> None:
+        """Size the prepared statement cache on each new pooled connection."""
+        conn.prepared_max = settings.db_prepared_max
+
     @property
     def pool(self) -> ConnectionPool:
         """Get the connection pool, initializing if needed."""
@@ -124,6 +130,7 @@ class DatabasePool:
         params: Optional[tuple] = None,
         fetch: bool = False,
         statement_timeout_ms: Optional[int] = None,
+        prepare: Optional[bool] = None,
     ) -> Optional[list[dict]]:
         """
         Execute a query with optional parameter binding.
@@ -133,6 +140,9 @@ class DatabasePool:
             params: Optional tuple of parameters
             fetch: If True, return fetched results
             statement_timeout_ms: Optional per-statement timeout (milliseconds)
+            prepare: If True, use a server-side prepared statement right away
+                (psycopg caches the plan per connection); None keeps psycopg's
+                default of preparing after repeated executions.
             
         Returns:
             List of dicts if fetch=True, else None
@@ -143,11 +153,37 @@ class DatabasePool:
                     "SELECT set_config('statement_timeout', %s, true)",
                     (f"{int(statement_timeout_ms)}ms",),
                 )
-            cur.execute(query, params)
+            cur.execute(query, params, prepare=prepare)
             if fetch:
                 return cur.fetchall()
         return None
     
+    def scalar(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        prepare: Optional[bool] = None,
+    ) -> Any:
+        """
+        Execute a query and return the first column of the first row.
+        
+        Uses a tuple cursor so single-value lookups (counts, MAX, EXISTS)
+        skip building a result dict.
+        
+        Args:
+            query: SQL query string
+            params: Optional tuple of parameters
+            prepare: Forwarded to psycopg (see execute)
+            
+        Returns:
+            The value, or None if the query returned no rows
+        """
+        with self.pool.connection() as conn:
+            with conn.cursor(row_factory=tuple_row) as cur:
+                cur.execute(query, params, prepare=prepare)
+                row = cur.fetchone()
+        return row[0] if row else None
+    
     def execute_many(self, query: str, params_seq: list[tuple]) -> int:
         """
         Execute a query with multiple parameter sets (batch insert).
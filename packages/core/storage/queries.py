@@ -15,6 +15,11 @@ from packages.core.storage.db import get_db_pool
 
 logger = logging.getLogger(__name__)
 
+# Windows the collector precomputes into movers_cache, ascending. Every
+# dashboard timeframe up to 12h is covered; longer windows would reach past
+# snapshot retention (settings.snapshot_retention_days) except for 24h.
+MOVERS_CACHE_WINDOWS = (300, 900, 1800, 3600, 14400, 43200, 86400)
+
 
 def _volume_freshness_clause(alias: str = "v") -> str:
     """Build a source-aware strict freshness clause for volume rows."""
@@ -24,6 +29,253 @@ def _volume_freshness_clause(alias: str = "v") -> str:
     )
 
 
+def _movers_window_direction(direction: str) -> tuple[str, str]:
+    """Filter and ORDER BY expression for a movers-window direction."""
+    if direction == "gainers":
+        return "AND pct_change > 0", "pct_change DESC"
+    if direction == "losers":
+        return "AND pct_change < 0", "pct_change ASC"
+    return "", "ABS(pct_change) DESC"
+
+
+def _movers_window_query(
+    window_seconds: int,
+    limit: int,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+    direction: str = "both",
+    min_abs_change: float = 0.0,
+    min_volume: float = 0.0,
+) -> tuple[str, list]:
+    """Build the live movers-window SQL and its params (see get_movers_window)."""
+    source_filter = "AND m.source = %s" if source else ""
+    category_filter = "AND m.category = %s" if category else ""
+
+    direction_filter, order = _movers_window_direction(direction)
+
+    # Thresholds are applied before LIMIT so strict filters still fill it
+    threshold_filter = ""
+    threshold_params: list[object] = []
+    if min_abs_change > 0:
+        threshold_filter += " AND ABS(pct_change) >= %s"
+        threshold_params.append(min_abs_change)
+    if min_volume > 0:
+        threshold_filter += " AND latest_volume >= %s"
+        threshold_params.append(min_volume)
+    
+    # Filter markets ending very soon
+    expiry_filter = "AND (m.end_date IS NULL OR m.end_date > NOW() + INTERVAL '24 hours')"
+
+    query = f"""
+        WITH scoped_tokens AS (
+            SELECT
+                mt.token_id,
+                mt.market_id,
+                mt.outcome,
+                m.title,
+                m.source,
+                m.category,
+                m.source_id,
+                m.url
+            FROM market_tokens mt
+            JOIN markets m ON mt.market_id = m.market_id
+            WHERE m.status = 'active'
+              {source_filter}
+              {category_filter}
+              {expiry_filter}
+        ),
+        token_prices AS (
+            SELECT
+                st.token_id,
+                st.market_id,
+                st.outcome,
+                st.title,
+                st.source,
+                st.category,
+                st.source_id,
+                st.url,
+                latest.latest_ts,
+                latest.latest_price,
+                historical.old_price
+            FROM scoped_tokens st
+            JOIN LATERAL (
+                SELECT
+                    s.ts as latest_ts,
+                    s.price as latest_price
+                FROM snapshots s
+                WHERE s.token_id = st.token_id
+                ORDER BY s.ts DESC
+                LIMIT 1
+            ) latest ON TRUE
+            JOIN LATERAL (
+                SELECT
+                    s.price as old_price
+                FROM snapshots s
+                WHERE s.token_id = st.token_id
+                  AND s.ts <= NOW() - (%s * INTERVAL '1 second')
+                ORDER BY s.ts DESC
+                LIMIT 1
+            ) historical ON TRUE
+        ),
+        latest_volumes AS (
+            -- Get latest volume with WSS preference for scoped tokens only.
+            SELECT
+                v.token_id,
+                v.volume_24h as latest_volume,
+                v.volume_source,
+                v.wss_trade_count
+            FROM v_latest_volumes v
+            JOIN scoped_tokens st ON st.token_id = v.token_id
+            WHERE v.has_volume_data = true
+              AND v.is_volume_fresh = true
+              AND {_volume_freshness_clause("v")}
+        ),
+        changes AS (
+            SELECT
+                tp.token_id,
+                tp.latest_ts,
+                tp.latest_price::float8 as latest_price,
+                COALESCE(lv.latest_volume, 0)::float8 as latest_volume,
+                lv.volume_source,
+                lv.wss_trade_count,
+                tp.old_price::float8 as old_price,
+                ROUND(((tp.latest_price - tp.old_price) * 100)::numeric, 2)::float8 as pct_change,
+                tp.market_id,
+                tp.outcome,
+                tp.title,
+                tp.source,
+                tp.category,
+                tp.source_id,
+                tp.url
+            FROM token_prices tp
+            LEFT JOIN latest_volumes lv ON tp.token_id = lv.token_id
+        )
+        SELECT *
+        FROM changes
+        WHERE 1 = 1
+          {direction_filter}
+          {threshold_filter}
+        ORDER BY {order}
+        LIMIT %s
+    """
+
+    params: list[object] = []
+    if source:
+        params.append(source)
+    if category:
+        params.append(category)
+    params.extend(
+        [
+            window_seconds,
+            settings.volume_wss_stale_after_seconds,
+            settings.volume_provider_stale_after_seconds,
+        ]
+    )
+    params.extend(threshold_params)
+    params.append(limit)
+    return query, params
+
+
+def _cached_movers_query(
+    window_seconds: int,
+    limit: int,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+    direction: str = "both",
+    min_abs_change: float = 0.0,
+    min_volume: float = 0.0,
+) -> tuple[str, list]:
+    """Build the movers-cache SQL and its params (see get_cached_movers)."""
+    source_filter = "AND m.source = %s" if source else ""
+    category_filter = "AND m.category = %s" if category else ""
+    change_filter = "AND mc.abs_move_pp >= %s" if min_abs_change > 0 else ""
+    # Volume falls back to the latest snapshot, which is only joined in the
+    # outer query; with a volume floor the LIMIT moves there too.
+    if min_volume > 0:
+        base_limit = ""
+        volume_filter = "WHERE COALESCE(b.volume_24h, lv.latest_volume, 0) >= %s"
+        outer_limit = "LIMIT %s"
+    else:
+        base_limit = "LIMIT %s"
+        volume_filter = ""
+        outer_limit = ""
+    
+    if direction == "gainers":
+        direction_filter = "AND mc.move_pp > 0"
+    elif direction == "losers":
+        direction_filter = "AND mc.move_pp < 0"
+    else:
+        direction_filter = ""
+        
+    # Use latest cache batch first, then do per-row volume fallback with LATERAL.
+    # This avoids an expensive full-table DISTINCT ON over snapshots.
+    query = f"""
+        WITH latest_batch AS (
+            SELECT MAX(as_of_ts) as max_ts
+            FROM movers_cache
+            WHERE window_seconds = %s
+        ),
+        base AS (
+            SELECT
+                mc.*,
+                mc.move_pp::float8 as pct_change, -- Alias for compat
+                mc.price_now::float8 as latest_price,
+                mc.price_then::float8 as old_price,
+                mc.spike_ratio as cached_spike_ratio,
+                mt.market_id,
+                mt.outcome,
+                mt.symbol,
+                m.title,
+                m.source,
+                m.category,
+                m.source_id,
+                m.url,
+                m.status,
+                m.end_date
+            FROM movers_cache mc
+            JOIN latest_batch lb ON mc.as_of_ts = lb.max_ts
+            JOIN market_tokens mt ON mc.token_id = mt.token_id
+            JOIN markets m ON mt.market_id = m.market_id
+            WHERE mc.window_seconds = %s
+              AND m.status = 'active'
+              AND (m.end_date IS NULL OR m.end_date > NOW())
+              {source_filter}
+              {category_filter}
+              {direction_filter}
+              {change_filter}
+            ORDER BY mc.rank ASC -- Pre-calculated rank
+            {base_limit}
+        )
+        SELECT
+            b.*,
+            COALESCE(b.volume_24h, lv.latest_volume, 0)::float8 as latest_volume
+        FROM base b
+        LEFT JOIN LATERAL (
+            SELECT s.volume_24h as latest_volume
+            FROM snapshots s
+            WHERE s.token_id = b.token_id
+              AND s.volume_24h IS NOT NULL
+            ORDER BY s.ts DESC
+            LIMIT 1
+        ) lv ON TRUE
+        {volume_filter}
+        ORDER BY b.rank ASC
+        {outer_limit}
+    """
+    
+    params = [window_seconds, window_seconds]
+    if source:
+        params.append(source)
+    if category:
+        params.append(category)
+    if min_abs_change > 0:
+        params.append(min_abs_change)
+    if min_volume > 0:
+        params.append(min_volume)
+    params.append(limit)
+    return query, params
+
+
 @dataclass
 class MarketQueries:
     """
@@ -126,6 +378,57 @@ class MarketQueries:
         search_term = f"%{query}%"
         return db.execute(sql, (search_term, search_term, limit), fetch=True) or []
     
+    @staticmethod
+    def search_markets_with_top_token(query: str, limit: int = 20) -> list[dict]:
+        """
+        Search active markets and return each hit joined to its top token.
+
+        One row per market (YES token preferred) with latest price/volume, so
+        search results can be rendered like movers without a second query.
+        """
+        db = get_db_pool()
+        sql = """
+            SELECT
+                m.market_id,
+                m.title,
+                m.source,
+                m.category,
+                t.token_id,
+                t.outcome,
+                COALESCE(lp.price, 0)::float8 as latest_price,
+                COALESCE(lvol.volume_24h, 0)::float8 as latest_volume,
+                0::float8 as pct_change,
+                0::float8 as old_price
+            FROM markets m
+            JOIN LATERAL (
+                SELECT mt.token_id, mt.outcome
+                FROM market_tokens mt
+                WHERE mt.market_id = m.market_id
+                ORDER BY CASE WHEN mt.outcome = 'YES' THEN 0 ELSE 1 END
+                LIMIT 1
+            ) t ON TRUE
+            LEFT JOIN LATERAL (
+                SELECT s.price
+                FROM snapshots s
+                WHERE s.token_id = t.token_id
+                ORDER BY s.ts DESC
+                LIMIT 1
+            ) lp ON TRUE
+            LEFT JOIN LATERAL (
+                SELECT s.volume_24h
+                FROM snapshots s
+                WHERE s.token_id = t.token_id
+                  AND s.volume_24h IS NOT NULL
+                ORDER BY s.ts DESC
+                LIMIT 1
+            ) lvol ON TRUE
+            WHERE (m.title ILIKE %s OR m.category ILIKE %s)
+              AND m.status = 'active'
+            LIMIT %s
+        """
+        search_term = f"%{query}%"
+        return db.execute(sql, (search_term, search_term, limit), fetch=True) or []
+    
     # =========================================================================
     # TOKEN OPERATIONS
     # =========================================================================
@@ -280,7 +583,51 @@ class MarketQueries:
             params = (str(token_id), start_ts)
         
         return db.execute(query, params, fetch=True) or []
-    
+
+    @staticmethod
+    def get_snapshots_downsampled_bulk(
+        token_ids: list[str],
+        start_ts: datetime,
+        bucket_seconds: int,
+    ) -> dict[str, list[dict]]:
+        """
+        Get snapshots for several tokens since `start_ts` in one round trip,
+        averaged into `bucket_seconds` buckets in SQL so at most one row per
+        token per bucket is returned.
+
+        Each row's ts is its bucket start; price and spread are bucket means.
+        Returns a dict keyed by token_id (str); tokens without snapshots in
+        the window are absent.
+        """
+        if not token_ids:
+            return {}
+        db = get_db_pool()
+        rows = db.execute(
+            """
+            SELECT
+                token_id,
+                to_timestamp(floor(extract(epoch FROM ts) / %s) * %s) AS ts,
+                AVG(price) AS price,
+                AVG(spread) AS spread
+            FROM snapshots
+            WHERE token_id = ANY(%s::uuid[]) AND ts >= %s
+            GROUP BY 1, 2
+            ORDER BY 1, 2
+            """,
+            (
+                bucket_seconds,
+                bucket_seconds,
+                [str(token_id) for token_id in token_ids],
+                start_ts,
+            ),
+            fetch=True,
+        ) or []
+
+        histories: dict[str, list[dict]] = {}
+        for row in rows:
+            histories.setdefault(str(row["token_id"]), []).append(row)
+        return histories
+
     # =========================================================================
     # TOP MOVERS QUERIES
     # =========================================================================
@@ -418,6 +765,8 @@ class MarketQueries:
         category: Optional[str] = None,
         direction: str = "both",
         statement_timeout_ms: int = 4500,
+        min_abs_change: float = 0.0,
+        min_volume: float = 0.0,
     ) -> list[dict]:
         """
         Get top price movers over an arbitrary time window in seconds.
@@ -433,130 +782,20 @@ class MarketQueries:
             category: Optional category filter  
             direction: 'both', 'gainers', or 'losers'
             statement_timeout_ms: Per-query timeout applied in the DB session
+            min_abs_change: Only movers with |pct_change| (pp) at least this
+            min_volume: Only movers with fresh 24h volume at least this
         """
         db = get_db_pool()
 
-        source_filter = "AND m.source = %s" if source else ""
-        category_filter = "AND m.category = %s" if category else ""
-
-        if direction == "gainers":
-            direction_filter = "AND pct_change > 0"
-            order = "pct_change DESC"
-        elif direction == "losers":
-            direction_filter = "AND pct_change < 0"
-            order = "pct_change ASC"
-        else:
-            direction_filter = ""
-            order = "ABS(pct_change) DESC"
-        
-        # Filter markets ending very soon
-        expiry_filter = "AND (m.end_date IS NULL OR m.end_date > NOW() + INTERVAL '24 hours')"
-
-        query = f"""
-            WITH scoped_tokens AS (
-                SELECT
-                    mt.token_id,
-                    mt.market_id,
-                    mt.outcome,
-                    m.title,
-                    m.source,
-                    m.category,
-                    m.source_id,
-                    m.url
-                FROM market_tokens mt
-                JOIN markets m ON mt.market_id = m.market_id
-                WHERE m.status = 'active'
-                  {source_filter}
-                  {category_filter}
-                  {expiry_filter}
-            ),
-            token_prices AS (
-                SELECT
-                    st.token_id,
-                    st.market_id,
-                    st.outcome,
-                    st.title,
-                    st.source,
-                    st.category,
-                    st.source_id,
-                    st.url,
-                    latest.latest_ts,
-                    latest.latest_price,
-                    historical.old_price
-                FROM scoped_tokens st
-                JOIN LATERAL (
-                    SELECT
-                        s.ts as latest_ts,
-                        s.price as latest_price
-                    FROM snapshots s
-                    WHERE s.token_id = st.token_id
-                    ORDER BY s.ts DESC
-                    LIMIT 1
-                ) latest ON TRUE
-                JOIN LATERAL (
-                    SELECT
-                        s.price as old_price
-                    FROM snapshots s
-                    WHERE s.token_id = st.token_id
-                      AND s.ts <= NOW() - (%s * INTERVAL '1 second')
-                    ORDER BY s.ts DESC
-                    LIMIT 1
-                ) historical ON TRUE
-            ),
-            latest_volumes AS (
-                -- Get latest volume with WSS preference for scoped tokens only.
-                SELECT
-                    v.token_id,
-                    v.volume_24h as latest_volume,
-                    v.volume_source,
-                    v.wss_trade_count
-                FROM v_latest_volumes v
-                JOIN scoped_tokens st ON st.token_id = v.token_id
-                WHERE v.has_volume_data = true
-                  AND v.is_volume_fresh = true
-                  AND {_volume_freshness_clause("v")}
-            ),
-            changes AS (
-                SELECT
-                    tp.token_id,
-                    tp.latest_ts,
-                    tp.latest_price,
-                    COALESCE(lv.latest_volume, 0) as latest_volume,
-                    lv.volume_source,
-                    lv.wss_trade_count,
-                    tp.old_price,
-                    ROUND(((tp.latest_price - tp.old_price) * 100)::numeric, 2) as pct_change,
-                    tp.market_id,
-                    tp.outcome,
-                    tp.title,
-                    tp.source,
-                    tp.category,
-                    tp.source_id,
-                    tp.url
-                FROM token_prices tp
-                LEFT JOIN latest_volumes lv ON tp.token_id = lv.token_id
-            )
-            SELECT *
-            FROM changes
-            WHERE 1 = 1
-              {direction_filter}
-            ORDER BY {order}
-            LIMIT %s
-        """
-
-        params: list[object] = []
-        if source:
-            params.append(source)
-        if category:
-            params.append(category)
-        params.extend(
-            [
-                window_seconds,
-                settings.volume_wss_stale_after_seconds,
-                settings.volume_provider_stale_after_seconds,
-            ]
+        query, params = _movers_window_query(
+            window_seconds,
+            limit,
+            source=source,
+            category=category,
+            direction=direction,
+            min_abs_change=min_abs_change,
+            min_volume=min_volume,
         )
-        params.append(limit)
 
         try:
             return db.execute(
@@ -564,6 +803,7 @@ class MarketQueries:
                 tuple(params),
                 fetch=True,
                 statement_timeout_ms=statement_timeout_ms,
+                prepare=True,
             ) or []
         except Exception as e:
             logger.warning(
@@ -750,6 +990,24 @@ class MarketQueries:
         return result[0] if result else None
 
 
+# Columns both get_cached_movers and get_movers_window return with matching
+# types; get_movers_with_fallback selects these from either branch.
+_FALLBACK_MOVER_COLUMNS = (
+    "token_id",
+    "market_id",
+    "outcome",
+    "title",
+    "source",
+    "category",
+    "source_id",
+    "url",
+    "latest_price",
+    "old_price",
+    "pct_change",
+    "latest_volume",
+)
+
+
 @dataclass
 class AnalyticsQueries:
     """
@@ -993,93 +1251,115 @@ class AnalyticsQueries:
         source: Optional[str] = None,
         category: Optional[str] = None,
         direction: str = "both",
+        min_abs_change: float = 0.0,
+        min_volume: float = 0.0,
     ) -> list[dict]:
         """
         Get top movers from the cache (fast).
         Includes join for market details.
+
+        min_abs_change (pp) and min_volume are applied before LIMIT, so
+        strict filters still return up to `limit` rows.
         """
         db = get_db_pool()
-        
-        source_filter = "AND m.source = %s" if source else ""
-        category_filter = "AND m.category = %s" if category else ""
-        
-        if direction == "gainers":
-            direction_filter = "AND mc.move_pp > 0"
-        elif direction == "losers":
-            direction_filter = "AND mc.move_pp < 0"
-        else:
-            direction_filter = ""
-            
-        # Use latest cache batch first, then do per-row volume fallback with LATERAL.
-        # This avoids an expensive full-table DISTINCT ON over snapshots.
+
+        query, params = _cached_movers_query(
+            window_seconds,
+            limit,
+            source=source,
+            category=category,
+            direction=direction,
+            min_abs_change=min_abs_change,
+            min_volume=min_volume,
+        )
+
+        try:
+            return db.execute(
+                query,
+                tuple(params),
+                fetch=True,
+                statement_timeout_ms=3500,
+                prepare=True,
+            ) or []
+        except Exception as e:
+            logger.warning(
+                "get_cached_movers query failed (window=%ss, source=%s, category=%s): %s",
+                window_seconds,
+                source,
+                category,
+                e,
+            )
+            return []
+
+    @staticmethod
+    def get_movers_with_fallback(
+        window_seconds: int = 3600,
+        limit: int = 20,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        direction: str = "both",
+        min_abs_change: float = 0.0,
+        min_volume: float = 0.0,
+        statement_timeout_ms: int = 4500,
+    ) -> list[dict]:
+        """
+        Cached movers, or live window movers when the cache has none, in one
+        round-trip.
+
+        The live branch sits behind an uncorrelated NOT EXISTS on the cached
+        rows, which Postgres evaluates once as a one-time filter, so the
+        window scan only runs on a cache miss. Both branches return the
+        columns in _FALLBACK_MOVER_COLUMNS with the same types as
+        get_movers_window, ranked by cache rank or by the window order.
+        """
+        db = get_db_pool()
+
+        filters = {
+            "source": source,
+            "category": category,
+            "direction": direction,
+            "min_abs_change": min_abs_change,
+            "min_volume": min_volume,
+        }
+        cached_query, cached_params = _cached_movers_query(window_seconds, limit, **filters)
+        live_query, live_params = _movers_window_query(window_seconds, limit, **filters)
+        _, live_order = _movers_window_direction(direction)
+        columns = ", ".join(_FALLBACK_MOVER_COLUMNS)
         query = f"""
-            WITH latest_batch AS (
-                SELECT MAX(as_of_ts) as max_ts
-                FROM movers_cache
-                WHERE window_seconds = %s
-            ),
-            base AS (
+            WITH cached AS ({cached_query}),
+            live AS ({live_query}),
+            picked AS (
                 SELECT
-                    mc.*,
-                    mc.move_pp as pct_change, -- Alias for compat
-                    mc.price_now as latest_price,
-                    mc.price_then as old_price,
-                    mc.spike_ratio as cached_spike_ratio,
-                    mt.market_id,
-                    mt.outcome,
-                    mt.symbol,
-                    m.title,
-                    m.source,
-                    m.category,
-                    m.source_id,
-                    m.url,
-                    m.status,
-                    m.end_date
-                FROM movers_cache mc
-                JOIN latest_batch lb ON mc.as_of_ts = lb.max_ts
-                JOIN market_tokens mt ON mc.token_id = mt.token_id
-                JOIN markets m ON mt.market_id = m.market_id
-                WHERE mc.window_seconds = %s
-                  AND m.status = 'active'
-                  AND (m.end_date IS NULL OR m.end_date > NOW())
-                  {source_filter}
-                  {category_filter}
-                  {direction_filter}
-                ORDER BY mc.rank ASC -- Pre-calculated rank
-                LIMIT %s
+                    {columns},
+                    NULL::text AS volume_source,
+                    0 AS branch,
+                    row_number() OVER (ORDER BY rank ASC) AS position
+                FROM cached
+                UNION ALL
+                SELECT
+                    {columns},
+                    volume_source::text,
+                    1,
+                    row_number() OVER (ORDER BY {live_order})
+                FROM live
+                WHERE NOT EXISTS (SELECT 1 FROM cached)
             )
-            SELECT
-                b.*,
-                COALESCE(b.volume_24h, lv.latest_volume, 0) as latest_volume
-            FROM base b
-            LEFT JOIN LATERAL (
-                SELECT s.volume_24h as latest_volume
-                FROM snapshots s
-                WHERE s.token_id = b.token_id
-                  AND s.volume_24h IS NOT NULL
-                ORDER BY s.ts DESC
-                LIMIT 1
-            ) lv ON TRUE
-            ORDER BY b.rank ASC
+            SELECT {columns}, volume_source
+            FROM picked
+            ORDER BY branch, position
         """
-        
-        params = [window_seconds, window_seconds]
-        if source:
-            params.append(source)
-        if category:
-            params.append(category)
-        params.append(limit)
 
         try:
             return db.execute(
                 query,
-                tuple(params),
+                tuple(cached_params + live_params),
                 fetch=True,
-                statement_timeout_ms=3500,
+                statement_timeout_ms=statement_timeout_ms,
+                prepare=True,
             ) or []
         except Exception as e:
             logger.warning(
-                "get_cached_movers query failed (window=%ss, source=%s, category=%s): %s",
+                "get_movers_with_fallback query failed (window=%ss, source=%s, category=%s): %s",
                 window_seconds,
                 source,
                 category,
@@ -1960,6 +2240,33 @@ class WatchlistQueries:
         """
         db.execute(query, (user_session_id, market_id))
 
+    @staticmethod
+    def bulk_update(
+        user_session_id: str,
+        add_market_ids: list[str],
+        remove_market_ids: list[str],
+    ) -> None:
+        """Apply several watchlist adds and removes in one transaction."""
+        db = get_db_pool()
+        with db.get_cursor() as cur:
+            if add_market_ids:
+                cur.execute(
+                    """
+                    INSERT INTO user_watchlist (user_session_id, market_id)
+                    SELECT %s, unnest(%s::uuid[])
+                    ON CONFLICT (user_session_id, market_id) DO NOTHING
+                    """,
+                    (user_session_id, add_market_ids),
+                )
+            if remove_market_ids:
+                cur.execute(
+                    """
+                    DELETE FROM user_watchlist
+                    WHERE user_session_id = %s AND market_id = ANY(%s::uuid[])
+                    """,
+                    (user_session_id, remove_market_ids),
+                )
+
 
 @dataclass
 class ArbitrageQueries:
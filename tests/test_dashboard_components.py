@@ -0,0 +1,369 @@
+from apps.dashboard.components import _SEVERITY_COLORS, format_volume, get_spike_badge
+
+
+def test_format_volume_magnitudes():
+    assert format_volume(0) == "$0"
+    assert format_volume(999) == "$999"
+    assert format_volume(1_000) == "$1.0k"
+    assert format_volume(12_345) == "$12.3k"
+    assert format_volume(1_000_000) == "$1.0M"
+    assert format_volume(2_560_000) == "$2.6M"
+    assert format_volume(1_250_000_000) == "$1.2B"
+
+
+def test_get_spike_badge_tiers():
+    assert get_spike_badge(None) == ""
+    assert get_spike_badge(1.2) == ""
+
+    low = get_spike_badge(1.5)
+    assert "↑ 1.5x vol" in low
+    assert "rgba(113, 113, 122, 0.2)" in low
+
+    medium = get_spike_badge(3.0)
+    assert "📈 3.0x VOL" in medium
+    assert "color: #fbbf24;" in medium
+
+    high = get_spike_badge(7.25)
+    assert "🔥 7.2x VOL" in high
+    assert "color: #ffa502;" in high
+
+    extreme = get_spike_badge(12)
+    assert "🔥 12.0x VOL" in extreme
+    assert "rgba(255, 71, 87, 0.2)" in extreme
+
+
+def test_mover_card_template_renders_escaped_fields():
+    from apps.dashboard.components import _CARD_TEMPLATE, _mover_card_fields, normalize_mover
+
+    fields = _mover_card_fields(
+        normalize_mover({
+            "market_id": "m1",
+            "title": "Will <b>X</b> happen?",
+            "source": "polymarket",
+            "outcome": "NO",
+            "pct_change": -4.25,
+            "old_price": 0.5,
+            "latest_price": 0.46,
+            "latest_volume": 12_000,
+        }),
+    )
+    html = _CARD_TEMPLATE.format_map(fields)
+
+    assert "Will &lt;b&gt;X&lt;/b&gt; happen?" in html
+    assert "$0.50 → $0.46" in html
+    assert "-4.2pp" in html
+    assert 'class="pmm-tag pmm-no"' in html
+    assert 'class="pmm-change pmm-down"' in html
+    assert "style=" not in html
+
+
+def test_normalize_mover_resolves_alternate_columns():
+    from apps.dashboard.components import normalize_mover
+
+    mover = normalize_mover(
+        {
+            "market_id": "m2",
+            "move_pp": "3.5",
+            "price_now": 0.61,
+            "price_then": 0.575,
+            "volume_24h": 5_000,
+            "volume_spike_ratio": "not-a-number",
+            "display_volume_is_stale": True,
+            "display_volume_age_seconds": 120,
+        }
+    )
+
+    assert mover.pct_change == 3.5
+    assert mover.latest_price == 0.61
+    assert mover.old_price == 0.575
+    assert mover.volume == 5_000
+    assert mover.spike_ratio is None
+    assert mover.stale_volume is True
+    assert mover.stale_age_seconds == 120.0
+    assert mover.title == ""
+    assert mover.outcome == "YES"
+
+
+def test_severity_backgrounds_match_hex_colors():
+    for color in _SEVERITY_COLORS.values():
+        channels = ", ".join(str(int(color.hex[i:i + 2], 16)) for i in (1, 3, 5))
+        assert color.bg == f"rgba({channels}, 0.2)"
+
+
+def test_spike_alert_html_uses_severity_palette():
+    from apps.dashboard.components import _spike_alert_html
+
+    html = _spike_alert_html(
+        {
+            "title": "A & B",
+            "outcome": "YES",
+            "spike_ratio": 6,
+            "current_volume": 60_000,
+            "avg_volume": 10_000,
+            "severity": "high",
+            "current_price": 0.42,
+        },
+        dark_mode=False,
+    )
+
+    assert "HIGH VOLUME SPIKE" in html
+    assert "rgba(255, 165, 2, 0.2)" in html
+    assert "A &amp; B (YES)" in html
+    assert "$60.0k volume (avg $10.0k) | $0.42" in html
+    assert "6.0x" in html
+
+
+def test_generate_reason_appends_spike_context():
+    from apps.dashboard.components import generate_reason
+
+    assert generate_reason(2.5, 1_500, "YES", None, use_html=False) == "**YES** spiked **2.5pp** on $1.5k vol"
+    assert generate_reason(-1.0, 0, "NO", 3.0, use_html=True) == (
+        "<strong>NO</strong> dropped <strong>1.0pp</strong> on $0 vol (<strong>3.0x</strong> normal)"
+    )
+
+
+def test_generate_reason_reuses_cached_text():
+    from apps.dashboard.components import _generate_reason_cached, generate_reason
+
+    first = generate_reason(4.2, 12_345, "YES", 2.5)
+    hits = _generate_reason_cached.cache_info().hits
+    # Raw values that render the same text share one cache entry
+    assert generate_reason(4.2031, 12_301.7, "YES", 2.4987) is first
+    assert _generate_reason_cached.cache_info().hits == hits + 1
+    # Values that render differently still get their own text
+    assert "$12.3k" in first and "$12.9k" in generate_reason(4.2, 12_945, "YES", 2.5)
+    assert "spiked" in generate_reason(0.04, 0, "YES") and "dropped" in generate_reason(-0.04, 0, "YES")
+    assert "normal" not in generate_reason(4.2, 0, "YES", 1.97)
+
+
+def test_mover_card_html_is_cached_per_mover():
+    from apps.dashboard.components import _mover_card_html, normalize_mover
+
+    row = {"market_id": "m3", "title": "Cached", "pct_change": 1.0}
+    html = _mover_card_html(normalize_mover(row))
+
+    assert _mover_card_html(normalize_mover(dict(row))) is html
+    assert _mover_card_html(normalize_mover({**row, "pct_change": 2.0})) is not html
+
+
+def test_mover_card_css_defines_both_themes():
+    from apps.dashboard.components import _MOVER_CARD_CSS
+
+    assert _MOVER_CARD_CSS.startswith("<style>")
+    assert ".pmm-dark {--pmm-card-bg:linear-gradient(135deg, #12121a 0%, #1a1a24 100%)" in _MOVER_CARD_CSS
+    assert ".pmm-light {--pmm-card-bg:#ffffff" in _MOVER_CARD_CSS
+
+
+def test_font_links_and_page_css_render_as_one_html_block():
+    import importlib
+
+    import pytest
+
+    from apps.dashboard.components import FONT_LINKS, minify_css
+
+    markdown_it = pytest.importorskip("markdown_it")
+    movers_page = importlib.import_module("apps.dashboard.pages.1_Top_Movers")
+    css = """
+    <style>
+        .a { color: red; }
+
+        .b { color: blue; }
+    </style>
+    """
+
+    for html in (FONT_LINKS + minify_css(css), *movers_page._THEME_CSS.values()):
+        tokens = markdown_it.MarkdownIt().parse(html)
+        assert [t.type for t in tokens] == ["html_block"]
+        assert tokens[0].content.rstrip().endswith("</style>")
+
+
+def test_components_module_defines_each_name_once():
+    import ast
+    from collections import Counter
+    from pathlib import Path
+
+    import apps.dashboard.components as components
+
+    tree = ast.parse(Path(components.__file__).read_text())
+    names = Counter(
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef))
+    )
+    assert [name for name, count in names.items() if count > 1] == []
+
+
+def test_lttb_indices_keeps_endpoints_and_peaks():
+    import numpy as np
+
+    from apps.dashboard.components import lttb_indices
+
+    x = np.arange(1_000, dtype=float)
+    y = np.zeros(1_000)
+    y[500] = 1.0
+
+    idx = lttb_indices(x, y, 50)
+
+    assert len(idx) == 50
+    assert idx[0] == 0 and idx[-1] == 999
+    assert 500 in idx
+    assert np.all(np.diff(idx) > 0)
+    assert list(lttb_indices(x[:10], y[:10], 50)) == list(range(10))
+
+
+def test_to_user_tz_series_converts_naive_utc_column(monkeypatch):
+    from datetime import datetime
+
+    import pandas as pd
+
+    import apps.dashboard.components as components
+
+    monkeypatch.setattr(components, "get_user_timezone", lambda: "America/New_York")
+    converted = components.to_user_tz_series(pd.Series([datetime(2024, 1, 1, 12, 0)]))
+
+    assert str(converted.dt.tz) == "America/New_York"
+    assert converted.iloc[0].hour == 7
+
+    monkeypatch.setattr(components, "get_user_timezone", lambda: "Not/AZone")
+    fallback = components.to_user_tz_series(pd.Series([datetime(2024, 1, 1, 12, 0)]))
+    assert str(fallback.dt.tz) == "UTC"
+
+
+
+class _SessionState(dict):
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+def test_get_user_timezone_resolves_once_and_caches_utc(monkeypatch):
+    import types
+
+    import apps.dashboard.components as components
+
+    calls = []
+
+    def fake_js(code, key=None):
+        calls.append(key)
+        return None
+
+    fake_st = types.SimpleNamespace(session_state=_SessionState(), context=types.SimpleNamespace())
+    monkeypatch.setattr(components, "st", fake_st)
+    monkeypatch.setattr(components, "st_javascript", fake_js)
+
+    assert components.get_user_timezone() == "UTC"
+    assert components.get_user_timezone() == "UTC"
+    assert calls == ["get_tz_js"]
+    assert fake_st.session_state["_tz_resolved"] is True
+
+
+def test_get_session_id_ignores_uid_query_param(monkeypatch):
+    import types
+
+    import apps.dashboard.components as components
+
+    fake_st = types.SimpleNamespace(
+        session_state=_SessionState(),
+        query_params={"uid": "someone-else"},
+        context=types.SimpleNamespace(cookies={"pm_movers_uid": "mine"}),
+    )
+    monkeypatch.setattr(components, "st", fake_st)
+    monkeypatch.setattr(components, "st_javascript", lambda code, key=None: None)
+
+    assert components.get_session_id() == "mine"
+    assert fake_st.query_params == {"uid": "someone-else"}
+
+
+def test_get_session_id_reads_cookie_without_js(monkeypatch):
+    import types
+
+    import apps.dashboard.components as components
+
+    def fail_js(code, key=None):
+        raise AssertionError("the cookie should make the JS round trip unnecessary")
+
+    fake_st = types.SimpleNamespace(
+        session_state=_SessionState(),
+        query_params={},
+        context=types.SimpleNamespace(cookies={"pm_movers_uid": "from-cookie"}),
+    )
+    monkeypatch.setattr(components, "st", fake_st)
+    monkeypatch.setattr(components, "st_javascript", fail_js)
+
+    assert components.get_session_id() == "from-cookie"
+    assert fake_st.session_state["_uid_resolved"] is True
+
+
+def test_toggle_watchlist_keeps_state_when_write_fails(monkeypatch):
+    import types
+
+    import apps.dashboard.components as components
+
+    def fail_add(uid, market_id):
+        raise RuntimeError("db down")
+
+    fake_st = types.SimpleNamespace(
+        session_state=_SessionState(
+            user_session_id="uid-1",
+            watchlist_initialized=True,
+            watchlist={},
+            watchlist_ids=frozenset(),
+        ),
+    )
+    monkeypatch.setattr(components, "st", fake_st)
+    monkeypatch.setattr(components.WatchlistQueries, "add", staticmethod(fail_add))
+
+    assert components.toggle_watchlist("m1", "Market", "kalshi") is None
+    assert fake_st.session_state.watchlist == {}
+    assert fake_st.session_state.watchlist_ids == frozenset()
+    assert fake_st.session_state["_pending_toasts"][0][1] == "⚠️"
+
+
+def test_write_watchlist_clears_only_the_writers_cache_entry(monkeypatch):
+    import types
+
+    import apps.dashboard.components as components
+
+    cleared = []
+    monkeypatch.setattr(components, "st", types.SimpleNamespace(session_state=_SessionState()))
+    monkeypatch.setattr(
+        components,
+        "_get_watchlist_cached",
+        types.SimpleNamespace(clear=lambda *args: cleared.append(args)),
+    )
+
+    assert components._write_watchlist(lambda uid, market_id: None, "uid-1", "m1") is True
+    assert cleared == [("uid-1",)]
+
+
+def test_submit_watchlist_form_resets_checkboxes_when_write_fails(monkeypatch):
+    import types
+
+    import apps.dashboard.components as components
+
+    def fail_bulk_update(uid, add, remove):
+        raise RuntimeError("db down")
+
+    fake_st = types.SimpleNamespace(
+        session_state=_SessionState(
+            user_session_id="uid-1",
+            watchlist_initialized=True,
+            watchlist={"m2": {}},
+            watchlist_ids=frozenset({"m2"}),
+            wl_m1=True,
+            wl_m2=False,
+        ),
+    )
+    monkeypatch.setattr(components, "st", fake_st)
+    monkeypatch.setattr(components, "get_session_id", lambda: "uid-1")
+    monkeypatch.setattr(components.WatchlistQueries, "bulk_update", staticmethod(fail_bulk_update))
+    markets = {
+        "m1": components.normalize_mover({"market_id": "m1", "title": "One"}),
+        "m2": components.normalize_mover({"market_id": "m2", "title": "Two"}),
+    }
+
+    components._submit_watchlist_form("wl", markets)
+
+    assert "wl_m1" not in fake_st.session_state
+    assert "wl_m2" not in fake_st.session_state
+    assert fake_st.session_state.watchlist_ids == frozenset({"m2"})
+    assert fake_st.session_state["_pending_toasts"][0][1] == "⚠️"
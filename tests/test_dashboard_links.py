@@ -70,9 +70,9 @@ def test_top_movers_hydration_overwrites_stale_url(monkeypatch):
                 }
             ]
 
-    monkeypatch.setattr(movers_page, "get_db_pool", lambda: FakeDB())
+    monkeypatch.setattr(movers_page, "get_dashboard_db_pool", lambda: FakeDB())
 
-    hydrated = movers_page._hydrate_market_context(
+    hydrated = movers_page._enrich_movers(
         [
             {
                 "market_id": market_id,
@@ -81,7 +81,8 @@ def test_top_movers_hydration_overwrites_stale_url(monkeypatch):
                 "category": "Sports",
                 "url": "https://polymarket.com/event/stale-link",
             }
-        ]
+        ],
+        stale_volume_fallback=False,
     )
 
     assert hydrated[0]["url"] == "https://polymarket.com/event/canonical-link"
@@ -92,8 +93,10 @@ def test_top_movers_stale_volume_fallback(monkeypatch):
     token_id = str(uuid.uuid4())
 
     class FakeDB:
-        def execute(self, _query, _params=None, fetch=False):
+        def execute(self, query, _params=None, fetch=False):
             assert fetch is True
+            if "FROM markets" in query:
+                return []
             return [
                 {
                     "token_id": token_id,
@@ -104,18 +107,134 @@ def test_top_movers_stale_volume_fallback(monkeypatch):
                 }
             ]
 
-    monkeypatch.setattr(movers_page, "get_db_pool", lambda: FakeDB())
+    monkeypatch.setattr(movers_page, "get_dashboard_db_pool", lambda: FakeDB())
 
-    movers = movers_page._apply_stale_volume_fallback(
+    movers = movers_page._enrich_movers(
         [
             {
                 "token_id": token_id,
                 "latest_volume": 0,
             }
         ],
-        enabled=True,
+        stale_volume_fallback=True,
     )
 
     assert movers[0]["display_volume"] == 12345.0
     assert movers[0]["display_volume_source"] == "gamma"
     assert movers[0]["display_volume_is_stale"] is True
+
+
+def test_top_movers_enrich_applies_context_and_stale_volume(monkeypatch):
+    movers_page = importlib.import_module("apps.dashboard.pages.1_Top_Movers")
+    market_id = str(uuid.uuid4())
+    token_id = str(uuid.uuid4())
+
+    class FakeDB:
+        def execute(self, query, _params=None, fetch=False):
+            assert fetch is True
+            if "FROM markets" in query:
+                return [{"market_id": market_id, "title": "Hydrated", "url": "https://kalshi.com/markets/x"}]
+            return [
+                {
+                    "token_id": token_id,
+                    "volume_24h": 500.0,
+                    "volume_source": "wss",
+                    "volume_age_seconds": 90,
+                    "is_volume_fresh": True,
+                }
+            ]
+
+    monkeypatch.setattr(movers_page, "get_dashboard_db_pool", lambda: FakeDB())
+
+    movers = movers_page._enrich_movers(
+        [{"market_id": market_id, "token_id": token_id, "latest_volume": 0}],
+        stale_volume_fallback=True,
+    )
+
+    assert movers[0]["title"] == "Hydrated"
+    assert movers[0]["url"] == "https://kalshi.com/markets/x"
+    assert movers[0]["display_volume"] == 500.0
+    assert movers[0]["display_volume_is_stale"] is False
+
+
+def test_top_movers_enrich_resolves_pool_on_calling_thread(monkeypatch):
+    import threading
+
+    movers_page = importlib.import_module("apps.dashboard.pages.1_Top_Movers")
+    pool_threads = []
+
+    class FakeDB:
+        def execute(self, query, _params=None, fetch=False):
+            return []
+
+    def fake_pool():
+        pool_threads.append(threading.current_thread())
+        return FakeDB()
+
+    monkeypatch.setattr(movers_page, "get_dashboard_db_pool", fake_pool)
+
+    movers_page._enrich_movers(
+        [{"market_id": str(uuid.uuid4()), "token_id": str(uuid.uuid4()), "latest_volume": 0}],
+        stale_volume_fallback=True,
+    )
+
+    assert pool_threads == [threading.current_thread()]
+
+
+def test_top_movers_min_volume_uses_stale_fallback_volume(monkeypatch):
+    movers_page = importlib.import_module("apps.dashboard.pages.1_Top_Movers")
+    calls = []
+
+    def fake_query(**kwargs):
+        calls.append(kwargs)
+        return [
+            {"token_id": "a", "latest_volume": 0},
+            {"token_id": "b", "latest_volume": 0},
+        ]
+
+    def fake_enrich(movers, *, stale_volume_fallback):
+        assert stale_volume_fallback is True
+        stale = {"a": 5000.0, "b": 10.0}
+        return [{**m, "display_volume": stale[m["token_id"]]} for m in movers]
+
+    monkeypatch.setattr(movers_page.MarketQueries, "get_movers_window", staticmethod(fake_query))
+    monkeypatch.setattr(movers_page, "_enrich_movers", fake_enrich)
+    movers_page._fetch_movers.clear()
+
+    movers = movers_page._fetch_movers(
+        7, 10, None, "both", None, 0.0, 1000.0, True
+    )
+
+    assert calls[0]["min_volume"] == 0.0
+    assert [m["token_id"] for m in movers] == ["a"]
+
+
+def test_top_movers_direction_options_reach_the_sql_filter(monkeypatch):
+    from packages.core.storage import queries
+
+    movers_page = importlib.import_module("apps.dashboard.pages.1_Top_Movers")
+    expected = {"Both": None, "Gainers Only": "pct_change > 0", "Losers Only": "pct_change < 0"}
+
+    class RecordingDB:
+        def __init__(self):
+            self.queries = []
+
+        def execute(self, query, params=None, fetch=False, statement_timeout_ms=None, prepare=None):
+            self.queries.append(" ".join(query.split()))
+            return []
+
+    monkeypatch.setattr(movers_page, "_enrich_movers", lambda movers, *, stale_volume_fallback: movers)
+    assert tuple(expected) == movers_page.DIRECTION_LABELS
+
+    for label, direction_filter in expected.items():
+        fake_db = RecordingDB()
+        monkeypatch.setattr(queries, "get_db_pool", lambda: fake_db)
+        movers_page._fetch_movers.clear()
+
+        movers_page._fetch_movers(7, 10, None, movers_page.DIRECTION_OPTIONS[label], None, 0.0, 0.0, False)
+
+        (query,) = fake_db.queries
+        if direction_filter is None:
+            assert "pct_change > 0" not in query and "pct_change < 0" not in query
+        else:
+            assert f"AND {direction_filter}" in query
@@ -59,6 +59,18 @@ class FakeDB:
         raise AssertionError(f"Unexpected query: {query}")
 
 
+class RecordingDB:
+    """Returns fixed rows and records each whitespace-normalized query with its params."""
+
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.calls = []
+
+    def execute(self, query, params=None, fetch=False, statement_timeout_ms=None, prepare=None):
+        self.calls.append((" ".join(query.split()), params))
+        return self.rows
+
+
 @pytest.mark.asyncio
 async def test_retention_cleanup_applies_table_policies(monkeypatch):
     fake_db = FakeDB()
@@ -164,3 +176,92 @@ def test_polymarket_snapshot_gate_write_after_interval():
         min_interval_seconds=5,
         force_delta_pp=0.5,
     )
+
+
+def test_get_movers_window_applies_thresholds_before_limit(monkeypatch):
+    from packages.core.storage import queries
+
+    fake_db = RecordingDB()
+    monkeypatch.setattr(queries, "get_db_pool", lambda: fake_db)
+
+    queries.MarketQueries.get_movers_window(
+        window_seconds=3600,
+        limit=25,
+        source="kalshi",
+        min_abs_change=2.5,
+        min_volume=1000,
+    )
+
+    query, params = fake_db.calls[0]
+    assert "AND ABS(pct_change) >= %s AND latest_volume >= %s ORDER BY" in query
+    assert params[0] == "kalshi"
+    assert params[-3:] == (2.5, 1000, 25)
+
+
+def test_get_cached_movers_moves_limit_outside_for_volume_floor(monkeypatch):
+    from packages.core.storage import queries
+
+    fake_db = RecordingDB()
+    monkeypatch.setattr(queries, "get_db_pool", lambda: fake_db)
+
+    queries.AnalyticsQueries.get_cached_movers(window_seconds=3600, limit=10, min_abs_change=1.0, min_volume=500)
+    query, params = fake_db.calls[0]
+    assert "AND mc.abs_move_pp >= %s" in query
+    assert "WHERE COALESCE(b.volume_24h, lv.latest_volume, 0) >= %s ORDER BY b.rank ASC LIMIT %s" in query
+    assert params == (3600, 3600, 1.0, 500, 10)
+
+    queries.AnalyticsQueries.get_cached_movers(window_seconds=3600, limit=10)
+    query, params = fake_db.calls[1]
+    assert "ORDER BY mc.rank ASC -- Pre-calculated rank LIMIT %s" in query
+    assert params == (3600, 3600, 10)
+
+
+def test_get_movers_with_fallback_gates_live_query_on_empty_cache(monkeypatch):
+    from packages.core.storage import queries
+
+    fake_db = RecordingDB(rows=[{"token_id": "tok-1", "pct_change": 4.5}])
+    monkeypatch.setattr(queries, "get_db_pool", lambda: fake_db)
+
+    rows = queries.AnalyticsQueries.get_movers_with_fallback(
+        window_seconds=3600,
+        limit=10,
+        source="kalshi",
+        min_abs_change=1.0,
+    )
+
+    assert rows == [{"token_id": "tok-1", "pct_change": 4.5}]
+    assert len(fake_db.calls) == 1
+    query, params = fake_db.calls[0]
+    assert "FROM live WHERE NOT EXISTS (SELECT 1 FROM cached)" in query
+    assert "to_jsonb" not in query
+    # Each branch is ranked explicitly, and branch order is kept
+    assert "row_number() OVER (ORDER BY rank ASC)" in query
+    assert "row_number() OVER (ORDER BY ABS(pct_change) DESC)" in query
+    assert query.endswith("ORDER BY branch, position")
+    # Cached params come first, then the live window params
+    assert params[:5] == (3600, 3600, "kalshi", 1.0, 10)
+    assert params[5:7] == ("kalshi", 3600)
+    assert params[-2:] == (1.0, 10)
+
+
+def test_get_snapshots_downsampled_bulk_buckets_in_sql(monkeypatch):
+    from packages.core.storage import queries
+
+    fake_db = RecordingDB(
+        rows=[
+            {"token_id": "a", "ts": 0, "price": 0.45, "spread": None},
+            {"token_id": "b", "ts": 0, "price": 0.6, "spread": 0.01},
+        ]
+    )
+    monkeypatch.setattr(queries, "get_db_pool", lambda: fake_db)
+    start_ts = datetime(2024, 1, 1)
+
+    histories = queries.MarketQueries.get_snapshots_downsampled_bulk(["a", "b"], start_ts, 30)
+
+    assert [row["price"] for row in histories["a"]] == [0.45]
+    assert [row["price"] for row in histories["b"]] == [0.6]
+    query, params = fake_db.calls[0]
+    assert "AVG(price) AS price" in query
+    assert "GROUP BY 1, 2" in query
+    assert params == (30, 30, ["a", "b"], start_ts)
+    assert queries.MarketQueries.get_snapshots_downsampled_bulk([], start_ts, 30) == {}